@@ -19,6 +19,87 @@ COLORS = {
     'neutral': '#9E9E9E',
 }
 
+# Max points per AES component (spider chart reference outline)
+AES_COMPONENT_MAX = {
+    'Sentiment': 25,
+    'Compliance': 30,
+    'Resolution': 30,
+    'Quality': 15,
+}
+
+
+def _build_spider_trend_skeleton() -> go.Figure:
+    """
+    Builds the static part of the spider + trend figure (subplot grid, axes, layout).
+    
+    Returns:
+        Plotly Figure with 2 empty subplots
+    """
+    
+    # Create subplot: 1 row, 2 columns
+    fig = make_subplots(
+        rows=1, cols=2,
+        specs=[[{'type': 'scatterpolar'}, {'type': 'scatter'}]],
+        subplot_titles=('Current State', '7-Day Trend'),
+        horizontal_spacing=0.15
+    )
+    
+    # Polar layout for spider chart
+    fig.update_polars(
+        radialaxis=dict(
+            visible=True,
+            range=[0, max(AES_COMPONENT_MAX.values())],
+            showticklabels=True,
+            tickfont=dict(size=10),
+            gridcolor='#e5e7eb'
+        ),
+        angularaxis=dict(
+            tickfont=dict(size=12, family='Inter', color='#1e3a5f')
+        ),
+        row=1, col=1
+    )
+    
+    # X-axis for trend chart
+    fig.update_xaxes(
+        title_text='Date',
+        showgrid=True,
+        gridcolor='#e5e7eb',
+        row=1, col=2
+    )
+    
+    # Y-axis for trend chart
+    fig.update_yaxes(
+        title_text='AES Score',
+        range=[0, 100],
+        showgrid=True,
+        gridcolor='#e5e7eb',
+        row=1, col=2
+    )
+    
+    # Overall layout
+    fig.update_layout(
+        height=400,
+        margin=dict(l=40, r=40, t=80, b=40),
+        paper_bgcolor='white',
+        plot_bgcolor='white',
+        font=dict(family='Inter', size=12),
+        showlegend=True,
+        legend=dict(
+            orientation="h",
+            yanchor="top",
+            y=-0.1,
+            xanchor="center",
+            x=0.5
+        )
+    )
+    
+    return fig
+
+
+# Built once at import - make_subplots + axis updates cost about as much as the traces themselves
+_SPIDER_TREND_SKELETON = _build_spider_trend_skeleton()
+
+
 
 def create_aes_spider_trend(
     current_components: Dict[str, float],
@@ -48,13 +129,12 @@ def create_aes_spider_trend(
         Plotly Figure with 2 subplots
     """
     
-    # Create subplot: 1 row, 2 columns
-    fig = make_subplots(
-        rows=1, cols=2,
-        specs=[[{'type': 'scatterpolar'}, {'type': 'scatter'}]],
-        subplot_titles=('Current State', '7-Day Trend'),
-        horizontal_spacing=0.15
-    )
+    # Copy of the prebuilt subplot grid (keeps row/col references for add_traces)
+    fig = go.Figure(_SPIDER_TREND_SKELETON)
+    
+    # Traces are collected with their subplot column and added in one batch
+    traces = []
+    trace_cols = []
     
     # ============================================================================
     # LEFT: SPIDER/RADAR CHART (Current State)
@@ -62,10 +142,8 @@ def create_aes_spider_trend(
     
     # Component names and max values
     components = {
-        'Sentiment': {'value': current_components.get('Sentiment', 0), 'max': 25},
-        'Compliance': {'value': current_components.get('Compliance', 0), 'max': 30},
-        'Resolution': {'value': current_components.get('Resolution', 0), 'max': 30},
-        'Quality': {'value': current_components.get('Quality', 0), 'max': 15}
+        name: {'value': current_components.get(name, 0), 'max': max_value}
+        for name, max_value in AES_COMPONENT_MAX.items()
     }
     
     # Prepare data for radar chart
@@ -92,43 +170,30 @@ def create_aes_spider_trend(
         fill_color = COLORS['critical']
         status = '🔴 Urgent'
     
-    # Add max reference (gray outline)
-    fig.add_trace(go.Scatterpolar(
-        r=max_values_closed,
-        theta=categories_closed,
-        fill=None,
-        line=dict(color=COLORS['neutral'], width=1, dash='dash'),
-        name='Max Possible',
-        showlegend=True,
-        hovertemplate='%{theta}<br>Max: %{r:.1f}<extra></extra>'
-    ), row=1, col=1)
-    
-    # Add actual values (filled)
-    fig.add_trace(go.Scatterpolar(
-        r=values_closed,
-        theta=categories_closed,
-        fill='toself',
-        fillcolor=f'rgba({int(fill_color[1:3], 16)}, {int(fill_color[3:5], 16)}, {int(fill_color[5:7], 16)}, 0.3)',
-        line=dict(color=fill_color, width=3),
-        name='Current',
-        showlegend=True,
-        hovertemplate='%{theta}<br>Current: %{r:.1f}<extra></extra>'
-    ), row=1, col=1)
-    
-    # Update polar layout
-    fig.update_polars(
-        radialaxis=dict(
-            visible=True,
-            range=[0, max(max_values)],
-            showticklabels=True,
-            tickfont=dict(size=10),
-            gridcolor='#e5e7eb'
+    traces += [
+        # Max reference (gray outline)
+        go.Scatterpolar(
+            r=max_values_closed,
+            theta=categories_closed,
+            fill=None,
+            line=dict(color=COLORS['neutral'], width=1, dash='dash'),
+            name='Max Possible',
+            showlegend=True,
+            hovertemplate='%{theta}<br>Max: %{r:.1f}<extra></extra>'
         ),
-        angularaxis=dict(
-            tickfont=dict(size=12, family='Inter', color='#1e3a5f')
+        # Actual values (filled)
+        go.Scatterpolar(
+            r=values_closed,
+            theta=categories_closed,
+            fill='toself',
+            fillcolor=f'rgba({int(fill_color[1:3], 16)}, {int(fill_color[3:5], 16)}, {int(fill_color[5:7], 16)}, 0.3)',
+            line=dict(color=fill_color, width=3),
+            name='Current',
+            showlegend=True,
+            hovertemplate='%{theta}<br>Current: %{r:.1f}<extra></extra>'
         ),
-        row=1, col=1
-    )
+    ]
+    trace_cols += [1, 1]
     
     # ============================================================================
     # RIGHT: 7-DAY TREND LINE CHART
@@ -154,30 +219,32 @@ def create_aes_spider_trend(
             is_improving = True
             fill_color_trend = COLORS['neutral']
         
-        # Add area fill (green if improving, red if declining)
-        fig.add_trace(go.Scatter(
-            x=df_trend['date_str'],
-            y=df_trend['aes'],
-            fill='tozeroy',
-            fillcolor=f'rgba({int(fill_color_trend[1:3], 16)}, {int(fill_color_trend[3:5], 16)}, {int(fill_color_trend[5:7], 16)}, 0.2)',
-            line=dict(color=fill_color_trend, width=3),
-            mode='lines+markers',
-            marker=dict(size=8, symbol='circle'),
-            name='AES',
-            showlegend=False,
-            hovertemplate='Date: %{x}<br>AES: %{y:.1f}%<extra></extra>'
-        ), row=1, col=2)
-        
-        # Add benchmark line
-        fig.add_trace(go.Scatter(
-            x=df_trend['date_str'],
-            y=[target] * len(df_trend),
-            mode='lines',
-            line=dict(color=COLORS['neutral'], width=2, dash='dash'),
-            name=f'Target ({target}%)',
-            showlegend=True,
-            hovertemplate=f'Target: {target}%<extra></extra>'
-        ), row=1, col=2)
+        traces += [
+            # Area fill (green if improving, red if declining)
+            go.Scatter(
+                x=df_trend['date_str'],
+                y=df_trend['aes'],
+                fill='tozeroy',
+                fillcolor=f'rgba({int(fill_color_trend[1:3], 16)}, {int(fill_color_trend[3:5], 16)}, {int(fill_color_trend[5:7], 16)}, 0.2)',
+                line=dict(color=fill_color_trend, width=3),
+                mode='lines+markers',
+                marker=dict(size=8, symbol='circle'),
+                name='AES',
+                showlegend=False,
+                hovertemplate='Date: %{x}<br>AES: %{y:.1f}%<extra></extra>'
+            ),
+            # Benchmark line
+            go.Scatter(
+                x=df_trend['date_str'],
+                y=[target] * len(df_trend),
+                mode='lines',
+                line=dict(color=COLORS['neutral'], width=2, dash='dash'),
+                name=f'Target ({target}%)',
+                showlegend=True,
+                hovertemplate=f'Target: {target}%<extra></extra>'
+            ),
+        ]
+        trace_cols += [2, 2]
         
         # Calculate trend percentage
         if len(df_trend) >= 2:
@@ -197,39 +264,7 @@ def create_aes_spider_trend(
             xanchor='center'
         )
     
-    # Update x-axis for trend chart
-    fig.update_xaxes(
-        title_text='Date',
-        showgrid=True,
-        gridcolor='#e5e7eb',
-        row=1, col=2
-    )
-    
-    # Update y-axis for trend chart
-    fig.update_yaxes(
-        title_text='AES Score',
-        range=[0, 100],
-        showgrid=True,
-        gridcolor='#e5e7eb',
-        row=1, col=2
-    )
-    
-    # Overall layout
-    fig.update_layout(
-        height=400,
-        margin=dict(l=40, r=40, t=80, b=40),
-        paper_bgcolor='white',
-        plot_bgcolor='white',
-        font=dict(family='Inter', size=12),
-        showlegend=True,
-        legend=dict(
-            orientation="h",
-            yanchor="top",
-            y=-0.1,
-            xanchor="center",
-            x=0.5
-        )
-    )
+    fig.add_traces(traces, rows=1, cols=trace_cols)
     
     return fig
 
@@ -291,7 +326,6 @@ def generate_mock_7day_trend(current_aes: float, variance: float = 3.0) -> List[
     Returns:
         List of {date, aes} dicts
     """
-    from datetime import datetime, timedelta
     
     trend = []
     today = datetime.now()
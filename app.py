@@ -31,13 +31,14 @@ import numpy as np
 from datetime import datetime, timedelta
 import os
 
-from data_generation import generate_dataset, get_transcript_for_call, detect_silences, detect_interruptions, calculate_speaking_rate
+from data_generation import generate_dataset, compact_dtypes, get_transcript_for_call, detect_silences, detect_interruptions, calculate_speaking_rate
 from metrics import (
     compliance_score, compute_sentiment_journey, is_fcr, calculate_fcr_rate,
     quality_binary_score, aes, calculate_aes_for_call, aci, calculate_tre,
     calculate_7day_trend, calculate_volume_distribution, calculate_aht,
     calculate_agent_aggregates, calculate_escalation_prevention_rate, compare_to_benchmark,
-    compute_sentiment_improvement_kpis, get_compliance_top_failures
+    compute_sentiment_improvement_kpis, get_compliance_top_failures, compute_overview_metrics,
+    precompute_call_columns
 )
 from ui_components import (
     create_gauge_chart, create_horizontal_bar_chart, create_trend_line_chart,
@@ -51,7 +52,15 @@ from aes_widget import create_aes_spider_trend, get_aes_status_card, generate_mo
 from csj_sankey import create_sentiment_sankey, calculate_sentiment_summary
 from quality_trend_widget import create_quality_trend_redesigned
 from fcr_widget import create_fcr_dual_gauge, get_fcr_insights
-from efficiency_bubble import create_efficiency_bubble_chart, get_efficiency_insights
+from efficiency_bubble import aggregate_topic_stats, create_efficiency_bubble_chart, get_efficiency_insights
+
+# Cieľové hodnoty a prahy gauge grafov
+AES_TARGET = 75.0
+COMPLIANCE_GAUGE_THRESHOLDS = {"low": 70, "medium": 85}
+EPR_GAUGE_THRESHOLDS = {"low": 80, "medium": 90}
+
+# Gauge grafy sú len indikatívne - bez hover/zoom handlerov a mode baru
+STATIC_CHART_CONFIG = {"staticPlot": True, "displayModeBar": False}
 
 st.set_page_config(page_title="CC Analytics Dashboard", page_icon="📊", layout="wide", initial_sidebar_state="expanded")
 
@@ -72,9 +81,30 @@ if "agents_df" not in st.session_state: st.session_state.agents_df = None
 if "config" not in st.session_state:
     st.session_state.config = {"n_calls": 200, "n_agents": 12, "seed": 42, "simulate_interruptions": False}
 
-@st.cache_data
+@st.cache_data(persist="disk")
 def load_data(n_calls, n_agents, seed, simulate_interruptions):
-    return generate_dataset(n_calls, n_agents, seed, simulate_interruptions)
+    calls_df, transcripts, agents_df = generate_dataset(n_calls, n_agents, seed, simulate_interruptions)
+    return precompute_call_columns(compact_dtypes(calls_df)), transcripts, agents_df
+
+@st.cache_data(show_spinner=False)
+def filter_options(dataset_fp, _calls_df):
+    """Hodnoty pre sidebar filtre (tímy, agenti, témy), raz na dataset."""
+    return (
+        sorted(_calls_df["team"].unique().tolist()),
+        sorted(_calls_df["agent_name"].unique().tolist()),
+        sorted(_calls_df["issue_category"].unique().tolist()),
+    )
+
+@st.cache_data
+def build_compliance_checkpoints(dataset_fp, call_id, duration_sec, _comp):
+    """Compliance checkpointy pre timeline hovoru, cache podľa datasetu a call_id."""
+    checkpoints = [
+        {"time": 5, "type": "Greeting", "passed": _comp.get("greeting_used", True), "description": "Agent properly greeted the customer"},
+        {"time": 15, "type": "Verification", "passed": _comp.get("customer_verification", False), "description": "Customer identity verified"},
+        {"time": duration_sec * 0.3, "type": "Data Protection", "passed": _comp.get("data_protection_mentioned", True), "description": "Data protection policy mentioned"},
+        {"time": duration_sec * 0.9, "type": "Call Summary", "passed": _comp.get("call_summarized", True), "description": "Agent provided call summary"},
+    ]
+    return checkpoints, sum(cp["passed"] for cp in checkpoints)
 
 def refresh_data():
     config = st.session_state.config
@@ -91,21 +121,21 @@ st.sidebar.markdown("*Powered by AI Intelligence*")
 st.sidebar.markdown("---")
 
 calls_df = st.session_state.calls_df
+# Fingerprint datasetu: konfigurácia generátora ho jednoznačne určuje (zdieľaný kľúč všetkých cache helperov)
+dataset_fp = tuple(st.session_state.config.values())
+all_teams, all_agents, all_topics = filter_options(dataset_fp, calls_df)
 min_date = calls_df["timestamp"].min().date()
 max_date = calls_df["timestamp"].max().date()
 
 st.sidebar.subheader("📅 DATE RANGE")
 date_range = st.sidebar.date_input("Select period", value=(min_date, max_date), min_value=min_date, max_value=max_date, label_visibility="collapsed")
 
-all_teams = sorted(calls_df["team"].unique().tolist())
 st.sidebar.subheader("👥 TEAM")
 selected_teams = st.sidebar.multiselect("Select teams", options=all_teams, default=[], label_visibility="collapsed", placeholder=f"All teams ({len(all_teams)})")
 
-all_agents = sorted(calls_df["agent_name"].unique().tolist())
 st.sidebar.subheader("👤 AGENT")
 selected_agents = st.sidebar.multiselect("Select agents", options=all_agents, default=[], label_visibility="collapsed", placeholder=f"All agents ({len(all_agents)})")
 
-all_topics = sorted(calls_df["resolution"].apply(lambda x: x["issue_category"]).unique().tolist())
 st.sidebar.subheader("🏷️ TOPIC")
 selected_topics = st.sidebar.multiselect("Select topics", options=all_topics, default=[], label_visibility="collapsed", placeholder=f"All topics ({len(all_topics)})")
 
@@ -128,25 +158,43 @@ with st.sidebar.expander("⚙️ Dataset Configuration", expanded=False):
     
     if st.button("🔄 Regenerate Dataset", type="primary"):
         st.session_state.config.update({"n_calls": new_n_calls, "n_agents": new_n_agents, "seed": new_seed, "simulate_interruptions": new_simulate_interruptions})
-        load_data.clear()
+        st.cache_data.clear()
+        st.cache_resource.clear()
         refresh_data()
         st.success("Dataset regenerated!")
         st.rerun()
 
 def apply_filters(df):
-    filtered = df.copy()
+    # Všetky filtre v jednej maske → jediná kópia (nie kópia + ďalšia po každom filtri)
+    mask = pd.Series(True, index=df.index)
     if len(date_range) == 2:
         start_date, end_date = date_range
-        filtered = filtered[(filtered["timestamp"].dt.date >= start_date) & (filtered["timestamp"].dt.date <= end_date)]
-    if selected_teams: filtered = filtered[filtered["team"].isin(selected_teams)]
-    if selected_agents: filtered = filtered[filtered["agent_name"].isin(selected_agents)]
-    if selected_topics: filtered = filtered[filtered["resolution"].apply(lambda x: x["issue_category"] in selected_topics)]
-    if selected_directions: filtered = filtered[filtered["direction"].isin(selected_directions)]
-    if selected_languages: filtered = filtered[filtered["language"].isin(selected_languages)]
-    return filtered
+        mask &= (df["timestamp"] >= pd.Timestamp(start_date)) & (df["timestamp"] < pd.Timestamp(end_date) + pd.Timedelta(days=1))
+    if selected_teams: mask &= df["team"].isin(selected_teams)
+    if selected_agents: mask &= df["agent_name"].isin(selected_agents)
+    if selected_topics: mask &= df["issue_category"].isin(selected_topics)
+    if selected_directions: mask &= df["direction"].isin(selected_directions)
+    if selected_languages: mask &= df["language"].isin(selected_languages)
+    return df[mask]
 
 filtered_calls = apply_filters(calls_df)
 
+# Fingerprint filtrovaného pohľadu: dataset + výber filtrov jednoznačne určujú filtered_calls
+view_fp = (
+    dataset_fp, tuple(date_range), tuple(selected_teams), tuple(selected_agents),
+    tuple(selected_topics), tuple(selected_directions), tuple(selected_languages),
+)
+
+@st.cache_data(show_spinner=False)
+def cached_view(widget, view_fp, _build):
+    """Výsledok widgetu pre daný pohľad - prepočíta sa len pri zmene datasetu alebo filtrov."""
+    return _build()
+
+@st.cache_resource(show_spinner=False, max_entries=100)
+def cached_figure(widget, view_fp, _build):
+    """Plotly figúra pre daný pohľad. Vracia sa priamo objekt (bez pickle round-tripu cache_data), figúry sa nemenia."""
+    return _build()
+
 # Professional Header with Brand Colors
 st.markdown("""
 <div style='text-align: center; padding: 2rem 0 1rem 0;'>
@@ -180,34 +228,18 @@ with tab_overview:
     if len(filtered_calls) == 0:
         st.warning("⚠️ No calls match the selected filters.")
     else:
-        filtered_calls["aes"] = filtered_calls.apply(calculate_aes_for_call, axis=1)
-        filtered_calls["comp_result"] = filtered_calls["compliance"].apply(compliance_score)
-        filtered_calls["quality_score"] = filtered_calls["quality"].apply(quality_binary_score)
-        filtered_calls["is_fcr"] = filtered_calls["resolution"].apply(is_fcr)
-        
         # ROW 1: AES Spider + Trend
         st.subheader("1️⃣ Agent Effectiveness Score (AES)")
         
-        # Calculate component scores
-        avg_sentiment_component = ((filtered_calls["sentiment_end"] - filtered_calls["sentiment_start"] + 2) / 4 * 100).mean() * 0.25
-        avg_compliance = filtered_calls["comp_result"].apply(lambda x: x["score"]).mean() * 0.30
-        avg_resolution = filtered_calls["resolution"].apply(lambda x: 100 if x["resolution_achieved"] == "full" else (50 if x["resolution_achieved"] == "partial" else 0)).mean() * 0.30
-        avg_quality = filtered_calls["quality_score"].mean() * 0.15
-        avg_aes = filtered_calls["aes"].mean()
+        # All scalar KPIs for the overview in one pass
+        overview = cached_view("overview", view_fp, lambda: compute_overview_metrics(filtered_calls))
+        avg_aes = overview["avg_aes"]
         
         # Component scores (without percentages in names)
-        components = {
-            "Sentiment": avg_sentiment_component,
-            "Compliance": avg_compliance,
-            "Resolution": avg_resolution,
-            "Quality": avg_quality
-        }
-        
-        # Generate 7-day trend data (mock)
-        trend_data = generate_mock_7day_trend(avg_aes, variance=2.5)
+        components = overview["components"]
         
         # Get status card info
-        status_info = get_aes_status_card(avg_aes, target=75.0)
+        status_info = get_aes_status_card(avg_aes, target=AES_TARGET)
         
         # Display big number card
         col1, col2, col3 = st.columns([1, 1, 2])
@@ -221,13 +253,13 @@ with tab_overview:
             st.markdown(f"### {status_info['status']}")
             st.caption(status_info['description'])
         
-        # Create and display spider + trend chart
-        fig_aes = create_aes_spider_trend(
+        # Create and display spider + trend chart (7-day trend data is mock)
+        fig_aes = cached_figure("aes", view_fp, lambda: create_aes_spider_trend(
             current_components=components,
-            trend_data=trend_data,
+            trend_data=generate_mock_7day_trend(avg_aes, variance=2.5),
             overall_aes=avg_aes,
-            target=75.0
-        )
+            target=AES_TARGET
+        ))
         st.plotly_chart(fig_aes, use_container_width=True)
         
         st.markdown("---")
@@ -239,12 +271,12 @@ with tab_overview:
         col1, col2 = st.columns([2, 1])
         with col1:
             # Create Sankey diagram
-            fig_sankey = create_sentiment_sankey(filtered_calls)
+            fig_sankey = cached_figure("sankey", view_fp, lambda: create_sentiment_sankey(filtered_calls))
             st.plotly_chart(fig_sankey, use_container_width=True)
         
         with col2:
             # Summary metrics
-            summary = calculate_sentiment_summary(filtered_calls)
+            summary = cached_view("sentiment_summary", view_fp, lambda: calculate_sentiment_summary(filtered_calls))
             
             st.markdown("#### 📊 Summary")
             st.metric(
@@ -309,13 +341,13 @@ with tab_overview:
         st.subheader("3️⃣ First Contact Resolution (FCR)")
         
         # Calculate both FCR metrics
-        fcr_stats = calculate_fcr_rate(filtered_calls)
+        fcr_stats = cached_view("fcr", view_fp, lambda: calculate_fcr_rate(filtered_calls))
         fcr_agent = fcr_stats['fcr_rate']
-        fcr_computed = (filtered_calls["resolution"].apply(lambda x: x["callback_needed"]) == "no").mean() * 100
+        fcr_computed = overview["fcr_computed"]
         
         # Create dual gauge chart
-        fig_fcr = create_fcr_dual_gauge(fcr_agent, fcr_computed)
-        st.plotly_chart(fig_fcr, use_container_width=True)
+        fig_fcr = cached_figure("fcr_gauge", view_fp, lambda: create_fcr_dual_gauge(fcr_agent, fcr_computed))
+        st.plotly_chart(fig_fcr, use_container_width=True, theme=None, config=STATIC_CHART_CONFIG)
         
         # Get insights
         insights = get_fcr_insights(fcr_agent, fcr_computed)
@@ -337,27 +369,28 @@ with tab_overview:
         col1, col2 = st.columns(2)
         with col1:
             st.markdown("**Compliance Risk**")
-            avg_comp_score = filtered_calls["comp_result"].apply(lambda x: x["score"]).mean()
-            fig_comp = create_gauge_chart(avg_comp_score, "Compliance Score", max_value=100, thresholds={"low": 70, "medium": 85})
-            st.plotly_chart(fig_comp, use_container_width=True)
-            top_failures = get_compliance_top_failures(filtered_calls, top_n=2)
-            critical_viol = filtered_calls["comp_result"].apply(lambda x: x["critical_violations_count"]).sum()
+            avg_comp_score = overview["avg_comp_score"]
+            fig_comp = cached_figure("compliance_gauge", view_fp, lambda: create_gauge_chart(avg_comp_score, "Compliance Score", max_value=100, thresholds=COMPLIANCE_GAUGE_THRESHOLDS))
+            st.plotly_chart(fig_comp, use_container_width=True, theme=None, config=STATIC_CHART_CONFIG)
+            top_failures = cached_view("compliance_failures", view_fp, lambda: get_compliance_top_failures(filtered_calls, top_n=2))
+            critical_viol = overview["critical_violations"]
             if top_failures:
                 st.markdown("**Top Compliance Issues:**")
-                for field, count in top_failures:
-                    st.markdown(f"- {field.replace('_', ' ').title()}: **{count}** failures")
+                st.markdown("\n".join(f"- {field.replace('_', ' ').title()}: **{count}** failures" for field, count in top_failures))
             if critical_viol > 0:
                 st.error(f"🚨 **{critical_viol}** critical violations detected")
         with col2:
             st.markdown("**Escalation Prevention Rate**")
-            epr_stats = calculate_escalation_prevention_rate(filtered_calls)
-            fig_epr = create_gauge_chart(epr_stats["epr"], "EPR", max_value=100, thresholds={"low": 80, "medium": 90})
-            st.plotly_chart(fig_epr, use_container_width=True)
+            epr_stats = cached_view("epr", view_fp, lambda: calculate_escalation_prevention_rate(filtered_calls))
+            fig_epr = cached_figure("epr_gauge", view_fp, lambda: create_gauge_chart(epr_stats["epr"], "EPR", max_value=100, thresholds=EPR_GAUGE_THRESHOLDS))
+            st.plotly_chart(fig_epr, use_container_width=True, theme=None, config=STATIC_CHART_CONFIG)
             if epr_stats["reasons_breakdown"]:
                 st.markdown("**Escalation Reasons:**")
-                for reason, count in epr_stats["reasons_breakdown"].items():
-                    pct = 100 * count / epr_stats["escalated_count"] if epr_stats["escalated_count"] > 0 else 0
-                    st.markdown(f"- {reason.title()}: **{count}** ({pct:.0f}%)")
+                escalated_count = epr_stats["escalated_count"]
+                st.markdown("\n".join(
+                    f"- {reason.title()}: **{count}** ({(100 * count / escalated_count if escalated_count > 0 else 0):.0f}%)"
+                    for reason, count in epr_stats["reasons_breakdown"].items()
+                ))
             else:
                 st.success("✅ No escalations in filtered period!")
         st.markdown("---")
@@ -366,29 +399,34 @@ with tab_overview:
         st.subheader("5️⃣ Topic Efficiency Matrix")
         
         # Create bubble chart
-        fig_efficiency = create_efficiency_bubble_chart(filtered_calls)
+        topic_stats = cached_view("topic_stats", view_fp, lambda: aggregate_topic_stats(filtered_calls))
+        fig_efficiency = cached_figure("efficiency", view_fp, lambda: create_efficiency_bubble_chart(filtered_calls, topic_stats))
         st.plotly_chart(fig_efficiency, use_container_width=True)
         
         # Get insights
-        eff_insights = get_efficiency_insights(filtered_calls)
+        eff_insights = cached_view("efficiency_insights", view_fp, lambda: get_efficiency_insights(filtered_calls, topic_stats))
         
         col1, col2 = st.columns(2)
         with col1:
             st.markdown("**⭐ Top Performers (High AES, Low AHT)**")
-            for topic in eff_insights['top_performers']:
-                st.markdown(f"- **{topic['topic']}**: {topic['aht']:.1f} min AHT, {topic['aes']:.1f} AES ({topic['volume']} calls)")
+            st.markdown("\n".join(
+                f"- **{topic['topic']}**: {topic['aht']:.1f} min AHT, {topic['aes']:.1f} AES ({topic['volume']} calls)"
+                for topic in eff_insights['top_performers']
+            ))
         
         with col2:
             st.markdown("**🔴 Needs Improvement (Low AES or High AHT)**")
-            for topic in eff_insights['needs_improvement']:
-                st.markdown(f"- **{topic['topic']}**: {topic['aht']:.1f} min AHT, {topic['aes']:.1f} AES ({topic['volume']} calls)")
+            st.markdown("\n".join(
+                f"- **{topic['topic']}**: {topic['aht']:.1f} min AHT, {topic['aes']:.1f} AES ({topic['volume']} calls)"
+                for topic in eff_insights['needs_improvement']
+            ))
         
         st.info(f"💡 **Overall**: Avg AHT = {eff_insights['avg_aht']:.1f} min, Avg AES = {eff_insights['avg_aes']:.1f}. Focus on improving topics in bottom-right quadrant.")
         st.markdown("---")
         
         # ROW 6: Quality Breakdown Trend - REDESIGNED
         st.subheader("6️⃣ 7-Day Quality Breakdown Trend")
-        fig_quality = create_quality_trend_redesigned(filtered_calls, target=75.0)
+        fig_quality = cached_figure("quality_trend", view_fp, lambda: create_quality_trend_redesigned(filtered_calls, target=AES_TARGET))
         st.plotly_chart(fig_quality, use_container_width=True)
         st.info("💡 Top: Overall AES trend line. Bottom: Stacked bars show component contributions.")
 
@@ -398,197 +436,188 @@ with tab_agents:
     if len(filtered_calls) == 0:
         st.warning("⚠️ No calls match filters.")
     else:
-        agent_agg = calculate_agent_aggregates(filtered_calls, st.session_state.agents_df)
+        agent_agg = cached_view("agents", view_fp, lambda: calculate_agent_aggregates(filtered_calls, st.session_state.agents_df))
         if len(agent_agg) > 0: st.dataframe(agent_agg, use_container_width=True, hide_index=True)
 
-# === TAB 3: CALLS ===
-with tab_calls:
-    st.header("📞 Call Details")
-    if len(filtered_calls) == 0:
-        st.warning("⚠️ No calls match filters.")
-    else:
-        st.subheader("📋 Calls List")
-        calls_display = filtered_calls.copy()
-        calls_display["topic"] = calls_display["resolution"].apply(lambda x: x["issue_category"])
-        calls_display["risk_level"] = calls_display["comp_result"].apply(lambda x: x["risk_level"])
-        calls_display["sentiment_delta"] = calls_display["sentiment_end"] - calls_display["sentiment_start"]
-        st.dataframe(calls_display[["call_id", "timestamp", "agent_name", "topic", "duration_sec", "aes", "is_fcr", "risk_level", "sentiment_delta"]].head(50), use_container_width=True, hide_index=True)
+@st.fragment
+def call_detail_view(calls_df, call_ids):
+    """Detail hovoru - zmena vybraného hovoru prepočíta len tento fragment, nie celú stránku."""
+    st.subheader("🔍 Call Detail View")
+    selected_call_id = st.selectbox("Select a call to view detailed timeline", options=call_ids)
+    
+    if selected_call_id:
+        call_row = calls_df.loc[calls_df["call_id"].eq(selected_call_id).idxmax()]
+        col1, col2, col3, col4 = st.columns(4)
+        with col1: st.metric("Agent", call_row["agent_name"])
+        with col2: st.metric("Duration", format_duration(call_row["duration_sec"]))
+        with col3: st.metric("AES", f"{call_row['aes']:.1f}")
+        with col4: st.metric("FCR", "✅ Yes" if call_row["is_fcr"] else "❌ No")
         
         st.markdown("---")
-        st.subheader("🔍 Call Detail View")
-        selected_call_id = st.selectbox("Select a call to view detailed timeline", options=calls_display["call_id"].tolist())
+        st.markdown("### 📊 Enhanced Call Timeline")
+        segments = get_transcript_for_call(selected_call_id, st.session_state.transcripts)
         
-        if selected_call_id:
-            call_row = filtered_calls[filtered_calls["call_id"] == selected_call_id].iloc[0]
-            col1, col2, col3, col4 = st.columns(4)
-            with col1: st.metric("Agent", call_row["agent_name"])
-            with col2: st.metric("Duration", format_duration(call_row["duration_sec"]))
-            with col3: st.metric("AES", f"{call_row['aes']:.1f}")
-            with col4: st.metric("FCR", "✅ Yes" if call_row["is_fcr"] else "❌ No")
+        if segments:
+            # Detect silences
+            silence_periods, _ = detect_silences(segments, call_row["duration_sec"])
             
-            st.markdown("---")
-            st.markdown("### 📊 Enhanced Call Timeline")
-            segments = get_transcript_for_call(selected_call_id, st.session_state.transcripts)
+            # Prepare compliance checkpoints (cached per call)
+            compliance_checkpoints, passed_count = build_compliance_checkpoints(
+                dataset_fp, selected_call_id, call_row["duration_sec"], call_row["compliance"]
+            )
             
-            if segments:
-                # Detect silences
-                silence_periods, _ = detect_silences(segments, call_row["duration_sec"])
-                
-                # Prepare compliance checkpoints
-                comp = call_row["compliance"]
-                compliance_checkpoints = [
-                    {
-                        "time": 5, 
-                        "type": "Greeting", 
-                        "passed": comp.get("greeting_used", True),
-                        "description": "Agent properly greeted the customer"
-                    },
-                    {
-                        "time": 15, 
-                        "type": "Verification", 
-                        "passed": comp.get("customer_verification", False),
-                        "description": "Customer identity verified"
-                    },
-                    {
-                        "time": call_row["duration_sec"] * 0.3, 
-                        "type": "Data Protection", 
-                        "passed": comp.get("data_protection_mentioned", True),
-                        "description": "Data protection policy mentioned"
-                    },
-                    {
-                        "time": call_row["duration_sec"] * 0.9, 
-                        "type": "Call Summary", 
-                        "passed": comp.get("call_summarized", True),
-                        "description": "Agent provided call summary"
-                    }
-                ]
-                
-                # Prepare sentiment points
-                sentiment_points = [
-                    {
-                        "time": 0, 
-                        "sentiment": call_row['sentiment_start'], 
-                        "label": "Start"
-                    },
-                    {
-                        "time": call_row["duration_sec"] / 2, 
-                        "sentiment": call_row['sentiment_middle'], 
-                        "label": "Mid"
-                    },
-                    {
-                        "time": call_row["duration_sec"], 
-                        "sentiment": call_row['sentiment_end'], 
-                        "label": "End"
-                    }
-                ]
-                
-                # Prepare WPM data (sample points throughout call)
-                import numpy as np
-                duration = call_row["duration_sec"]
-                num_points = 10
-                time_points = np.linspace(0, duration, num_points)
-                
-                agent_wpm_base = calculate_speaking_rate(segments, "AGENT")
-                customer_wpm_base = calculate_speaking_rate(segments, "CUSTOMER")
-                
-                wpm_data = {
-                    "agent": [
-                        {"time": t, "wpm": agent_wpm_base + np.random.uniform(-15, 15)} 
-                        for t in time_points
-                    ],
-                    "customer": [
-                        {"time": t, "wpm": customer_wpm_base + np.random.uniform(-15, 15)} 
-                        for t in time_points
-                    ]
+            # Prepare sentiment points
+            sentiment_points = [
+                {
+                    "time": 0, 
+                    "sentiment": call_row['sentiment_start'], 
+                    "label": "Start"
+                },
+                {
+                    "time": call_row["duration_sec"] / 2, 
+                    "sentiment": call_row['sentiment_middle'], 
+                    "label": "Mid"
+                },
+                {
+                    "time": call_row["duration_sec"], 
+                    "sentiment": call_row['sentiment_end'], 
+                    "label": "End"
                 }
-                
-                # Create enhanced timeline
-                fig_timeline = create_enhanced_timeline(
-                    segments=segments,
-                    compliance_checkpoints=compliance_checkpoints,
-                    sentiment_points=sentiment_points,
-                    wpm_data=wpm_data,
-                    silence_periods=silence_periods,
-                    call_duration=call_row["duration_sec"]
-                )
-                
-                st.plotly_chart(fig_timeline, use_container_width=True)
-                
-                # Summary stats
-                stats = calculate_timeline_stats(segments, silence_periods, wpm_data, sentiment_points)
-                
-                st.markdown("#### 📊 Call Statistics")
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    st.metric(
-                        "Pause (3-10s)", 
-                        f"{stats['pause_count']} ({stats['pause_total']:.0f}s)",
-                        help="Number and total duration of pauses"
-                    )
-                
-                with col2:
-                    hold_status = "🔴" if stats['hold_total'] > 30 else "✅"
-                    st.metric(
-                        "Hold (>10s)", 
-                        f"{hold_status} {stats['hold_count']} ({stats['hold_total']:.0f}s)",
-                        help="Number and total duration of holds"
-                    )
-                
-                with col3:
-                    st.metric(
-                        "Agent WPM", 
-                        f"Avg: {stats['agent_wpm_avg']:.0f}, Peak: {stats['agent_wpm_peak']:.0f}",
-                        help="Average and peak speaking rate"
-                    )
-                
-                with col4:
-                    delta_icon = "⬆️" if stats['sentiment_delta'] > 0.2 else ("⬇️" if stats['sentiment_delta'] < -0.2 else "➡️")
-                    st.metric(
-                        "Sentiment Δ", 
-                        f"{delta_icon} {stats['sentiment_delta']:+.2f}",
-                        help="Change from start to end"
-                    )
-                
-                # Compliance summary
-                passed_count = sum(1 for cp in compliance_checkpoints if cp['passed'])
-                total_count = len(compliance_checkpoints)
-                comp_pct = (passed_count / total_count) * 100 if total_count > 0 else 0
-                
-                st.markdown(f"**Compliance Score**: {passed_count}/{total_count} passed ({comp_pct:.0f}%)")
-                failed_checkpoints = [cp for cp in compliance_checkpoints if not cp['passed']]
-                if failed_checkpoints:
-                    st.error(f"❌ Failed: {', '.join([cp['type'] for cp in failed_checkpoints])}")
-            else:
-                st.info("No transcript available for this call.")
+            ]
+            
+            # Prepare WPM data (sample points throughout call)
+            duration = call_row["duration_sec"]
+            num_points = 10
+            time_points = np.linspace(0, duration, num_points)
+            
+            agent_wpm_base = calculate_speaking_rate(segments, "AGENT")
+            customer_wpm_base = calculate_speaking_rate(segments, "CUSTOMER")
+            
+            wpm_data = {
+                "agent": [
+                    {"time": t, "wpm": agent_wpm_base + np.random.uniform(-15, 15)} 
+                    for t in time_points
+                ],
+                "customer": [
+                    {"time": t, "wpm": customer_wpm_base + np.random.uniform(-15, 15)} 
+                    for t in time_points
+                ]
+            }
+            
+            # Create enhanced timeline
+            fig_timeline = create_enhanced_timeline(
+                segments=segments,
+                compliance_checkpoints=compliance_checkpoints,
+                sentiment_points=sentiment_points,
+                wpm_data=wpm_data,
+                silence_periods=silence_periods,
+                call_duration=call_row["duration_sec"]
+            )
             
-            st.markdown("---")
+            st.plotly_chart(fig_timeline, use_container_width=True)
+            
+            # Summary stats
+            stats = calculate_timeline_stats(segments, silence_periods, wpm_data, sentiment_points)
+            
+            st.markdown("#### 📊 Call Statistics")
+            col1, col2, col3, col4 = st.columns(4)
             
-            # Detail cards
-            col1, col2, col3 = st.columns(3)
             with col1:
-                st.markdown("**Compliance**")
-                comp = call_row["compliance"]
-                for k, v in comp.items():
-                    if isinstance(v, bool):
-                        icon = "✅" if v else "❌"
-                        st.markdown(f"{icon} {k.replace('_', ' ').title()}")
+                st.metric(
+                    "Pause (3-10s)", 
+                    f"{stats['pause_count']} ({stats['pause_total']:.0f}s)",
+                    help="Number and total duration of pauses"
+                )
+            
             with col2:
-                st.markdown("**Resolution**")
-                res = call_row["resolution"]
-                st.markdown(f"**Status**: {res['resolution_achieved'].title()}")
-                st.markdown(f"**Satisfied**: {'✅' if res['customer_satisfied'] else '❌'}")
-                st.markdown(f"**Escalated**: {'⚠️ Yes' if res['escalated'] else '✅ No'}")
+                hold_status = "🔴" if stats['hold_total'] > 30 else "✅"
+                st.metric(
+                    "Hold (>10s)", 
+                    f"{hold_status} {stats['hold_count']} ({stats['hold_total']:.0f}s)",
+                    help="Number and total duration of holds"
+                )
+            
             with col3:
-                st.markdown("**Quality**")
-                qual = call_row["quality"]
-                st.markdown(f"**Score**: {call_row['quality_score']:.0f}/100")
-                if qual.get("positive_moments"):
-                    for pm in qual["positive_moments"]:
-                        st.success(f"✨ {pm}")
-                if qual.get("negative_moments"):
-                    for nm in qual["negative_moments"]:
-                        st.error(f"⚠️ {nm}")
+                st.metric(
+                    "Agent WPM", 
+                    f"Avg: {stats['agent_wpm_avg']:.0f}, Peak: {stats['agent_wpm_peak']:.0f}",
+                    help="Average and peak speaking rate"
+                )
+            
+            with col4:
+                delta_icon = "⬆️" if stats['sentiment_delta'] > 0.2 else ("⬇️" if stats['sentiment_delta'] < -0.2 else "➡️")
+                st.metric(
+                    "Sentiment Δ", 
+                    f"{delta_icon} {stats['sentiment_delta']:+.2f}",
+                    help="Change from start to end"
+                )
+            
+            # Compliance summary
+            total_count = len(compliance_checkpoints)
+            comp_pct = (passed_count / total_count) * 100 if total_count > 0 else 0
+            
+            st.markdown(f"**Compliance Score**: {passed_count}/{total_count} passed ({comp_pct:.0f}%)")
+            failed_checkpoints = [cp for cp in compliance_checkpoints if not cp['passed']]
+            if failed_checkpoints:
+                st.error(f"❌ Failed: {', '.join([cp['type'] for cp in failed_checkpoints])}")
+        else:
+            st.info("No transcript available for this call.")
+        
+        st.markdown("---")
+        
+        # Detail cards
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.markdown("**Compliance**")
+            comp = call_row["compliance"]
+            st.markdown("\n\n".join(
+                f"{'✅' if v else '❌'} {k.replace('_', ' ').title()}"
+                for k, v in comp.items() if isinstance(v, bool)
+            ))
+        with col2:
+            st.markdown("**Resolution**")
+            res = call_row["resolution"]
+            st.markdown(
+                f"**Status**: {res['resolution_achieved'].title()}\n\n"
+                f"**Satisfied**: {'✅' if res['customer_satisfied'] else '❌'}\n\n"
+                f"**Escalated**: {'⚠️ Yes' if res['escalated'] else '✅ No'}"
+            )
+        with col3:
+            st.markdown("**Quality**")
+            qual = call_row["quality"]
+            st.markdown(f"**Score**: {call_row['quality_score']:.0f}/100")
+            if qual.get("positive_moments"):
+                for pm in qual["positive_moments"]:
+                    st.success(f"✨ {pm}")
+            if qual.get("negative_moments"):
+                for nm in qual["negative_moments"]:
+                    st.error(f"⚠️ {nm}")
+
+
+# === TAB 3: CALLS ===
+with tab_calls:
+    st.header("📞 Call Details")
+    if len(filtered_calls) == 0:
+        st.warning("⚠️ No calls match filters.")
+    else:
+        st.subheader("📋 Calls List")
+        # Len zobrazené riadky a stĺpce (bez kópie celého frame s dict stĺpcami)
+        shown = filtered_calls.head(50)
+        calls_display = pd.DataFrame({
+            "call_id": shown["call_id"],
+            "timestamp": shown["timestamp"],
+            "agent_name": shown["agent_name"],
+            "topic": shown["issue_category"],
+            "duration_sec": shown["duration_sec"],
+            "aes": shown["aes"].round(1),
+            "is_fcr": shown["is_fcr"],
+            "risk_level": shown["comp_risk_level"],
+            "sentiment_delta": shown["sentiment_end"] - shown["sentiment_start"],
+        })
+        st.dataframe(calls_display, use_container_width=True, hide_index=True)
+        
+        st.markdown("---")
+        call_detail_view(filtered_calls, filtered_calls["call_id"].tolist())
 
 # === TAB 4: CONFIG ===
 with tab_config:
@@ -5,7 +5,9 @@ Flow visualization showing sentiment changes from start to end
 
 import plotly.graph_objects as go
 import pandas as pd
-from typing import Dict, List
+import numpy as np
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 
 COLORS = {
@@ -16,6 +18,55 @@ COLORS = {
     'decline': '#EF5350',
 }
 
+# Sentiment buckets: < -0.3 Negative, < 0.3 Neutral, else Positive
+SENTIMENT_BUCKETS = np.array(['Negative', 'Neutral', 'Positive'])
+SENTIMENT_BUCKET_EDGES = np.array([-0.3, 0.3])
+
+# Semi-transparent link colors indexed by (start code, end code):
+# improvement = green, decline = red, no change = gray
+LINK_COLOR_LUT = np.array([
+    ['rgba(158, 158, 158, 0.3)', 'rgba(0, 200, 83, 0.4)', 'rgba(0, 200, 83, 0.4)'],
+    ['rgba(239, 83, 80, 0.4)', 'rgba(158, 158, 158, 0.3)', 'rgba(0, 200, 83, 0.4)'],
+    ['rgba(239, 83, 80, 0.4)', 'rgba(239, 83, 80, 0.4)', 'rgba(158, 158, 158, 0.3)'],
+])
+
+# Sankey nodes (6 total: 3 start + 3 end); end node index = end code + 3
+NODE_LABELS = [
+    '😠 Negative Start',
+    '😐 Neutral Start',
+    '😊 Positive Start',
+    '😠 Negative End',
+    '😐 Neutral End',
+    '😊 Positive End',
+]
+
+NODE_COLORS = [COLORS['negative'], COLORS['neutral'], COLORS['positive']] * 2
+
+SANKEY_LAYOUT = {
+    'title': {
+        'text': 'Sentiment Flow: Start → End',
+        'font': {'size': 16, 'family': 'Inter', 'color': '#1e3a5f'},
+    },
+    'height': 450,
+    'margin': {'l': 20, 'r': 20, 't': 60, 'b': 20},
+    'font': {'size': 12, 'family': 'Inter'},
+    'paper_bgcolor': 'white',
+}
+
+
+def bucket_codes(values) -> np.ndarray:
+    """
+    Vectorized sentiment bucketing.
+    
+    Args:
+        values: Array-like of sentiment scores (-1 to +1)
+        
+    Returns:
+        Int array of bucket codes (0 = Negative, 1 = Neutral, 2 = Positive)
+    """
+    # side='right' keeps the edges in the upper bucket (-0.3 is Neutral, 0.3 is Positive)
+    return np.searchsorted(SENTIMENT_BUCKET_EDGES, np.asarray(values), side='right')
+
 
 def create_sentiment_sankey(df: pd.DataFrame) -> go.Figure:
     """
@@ -25,127 +76,72 @@ def create_sentiment_sankey(df: pd.DataFrame) -> go.Figure:
         df: DataFrame with sentiment_start and sentiment_end columns
         
     Returns:
-        Plotly Sankey diagram
+        Plotly Sankey diagram (shared cached object - do not mutate)
     """
     
-    # Define sentiment buckets
-    def bucket_sentiment(s):
-        if s < -0.3:
-            return 'Negative'
-        elif s < 0.3:
-            return 'Neutral'
-        else:
-            return 'Positive'
-    
     # Bucket start and end sentiments
-    df = df.copy()
-    df['start_bucket'] = df['sentiment_start'].apply(bucket_sentiment)
-    df['end_bucket'] = df['sentiment_end'].apply(bucket_sentiment)
-    
-    # Count transitions
-    transitions = df.groupby(['start_bucket', 'end_bucket']).size().reset_index(name='count')
-    total_calls = len(df)
-    transitions['pct'] = (transitions['count'] / total_calls) * 100
-    
-    # Define nodes (6 total: 3 start + 3 end)
-    buckets = ['Negative', 'Neutral', 'Positive']
-    node_labels = [
-        '😠 Negative Start',
-        '😐 Neutral Start',
-        '😊 Positive Start',
-        '😠 Negative End',
-        '😐 Neutral End',
-        '😊 Positive End'
-    ]
+    start_codes = bucket_codes(df['sentiment_start'])
+    end_codes = bucket_codes(df['sentiment_end'])
     
-    node_colors = [
-        COLORS['negative'],  # Negative Start
-        COLORS['neutral'],   # Neutral Start
-        COLORS['positive'],  # Positive Start
-        COLORS['negative'],  # Negative End
-        COLORS['neutral'],   # Neutral End
-        COLORS['positive'],  # Positive End
-    ]
+    # Count transitions: 3x3 matrix indexed by (start code, end code)
+    transitions = np.bincount(start_codes * 3 + end_codes, minlength=9)
     
-    # Create mapping from bucket names to node indices
-    start_indices = {bucket: i for i, bucket in enumerate(buckets)}
-    end_indices = {bucket: i + 3 for i, bucket in enumerate(buckets)}
-    
-    # Prepare links (flows)
-    sources = []
-    targets = []
-    values = []
-    link_colors = []
-    link_labels = []
-    
-    for _, row in transitions.iterrows():
-        start_bucket = row['start_bucket']
-        end_bucket = row['end_bucket']
-        count = row['count']
-        pct = row['pct']
-        
-        source_idx = start_indices[start_bucket]
-        target_idx = end_indices[end_bucket]
-        
-        sources.append(source_idx)
-        targets.append(target_idx)
-        values.append(count)
-        
-        # Determine link color based on improvement/decline
-        if start_bucket == 'Negative' and end_bucket in ['Neutral', 'Positive']:
-            color = COLORS['improvement']  # Green - improvement
-        elif start_bucket == 'Neutral' and end_bucket == 'Positive':
-            color = COLORS['improvement']  # Green - improvement
-        elif start_bucket == 'Positive' and end_bucket in ['Neutral', 'Negative']:
-            color = COLORS['decline']  # Red - decline
-        elif start_bucket == 'Neutral' and end_bucket == 'Negative':
-            color = COLORS['decline']  # Red - decline
-        else:
-            color = COLORS['neutral']  # Gray - no change
-        
-        # Make color semi-transparent for link
-        if color == COLORS['improvement']:
-            link_color = 'rgba(0, 200, 83, 0.4)'
-        elif color == COLORS['decline']:
-            link_color = 'rgba(239, 83, 80, 0.4)'
-        else:
-            link_color = 'rgba(158, 158, 158, 0.3)'
+    # The figure depends only on the 9 transition counts
+    return _build_sankey(tuple(transitions.tolist()))
+
+
+@lru_cache(maxsize=32)
+def _build_sankey(transition_counts: Tuple[int, ...]) -> go.Figure:
+    """
+    Builds the Sankey figure from flattened 3x3 transition counts (memoized).
+    
+    Args:
+        transition_counts: Row-major counts indexed by (start code, end code)
         
-        link_colors.append(link_color)
-        link_labels.append(f"{start_bucket} → {end_bucket}: {pct:.1f}% ({count} calls)")
-    
-    # Create Sankey diagram
-    fig = go.Figure(data=[go.Sankey(
-        node=dict(
-            pad=20,
-            thickness=25,
-            line=dict(color='white', width=2),
-            label=node_labels,
-            color=node_colors,
-            hovertemplate='%{label}<br>%{value} calls<extra></extra>'
-        ),
-        link=dict(
-            source=sources,
-            target=targets,
-            value=values,
-            color=link_colors,
-            hovertemplate='%{label}<extra></extra>',
-            label=link_labels
-        )
-    )])
-    
-    fig.update_layout(
-        title=dict(
-            text='Sentiment Flow: Start → End',
-            font=dict(size=16, family='Inter', color='#1e3a5f')
-        ),
-        height=450,
-        margin=dict(l=20, r=20, t=60, b=20),
-        font=dict(size=12, family='Inter'),
-        paper_bgcolor='white'
-    )
-    
-    return fig
+    Returns:
+        Plotly Sankey diagram
+    """
+    
+    transitions = np.array(transition_counts).reshape(3, 3)
+    total_calls = int(transitions.sum())
+    
+    # Prepare links (flows): observed transitions only, in (start, end) bucket order;
+    # end nodes are offset by 3
+    start_idx, end_idx = np.nonzero(transitions)
+    counts = transitions[start_idx, end_idx]
+    
+    sources = start_idx.tolist()
+    targets = (end_idx + 3).tolist()
+    values = counts.tolist()
+    link_colors = LINK_COLOR_LUT[start_idx, end_idx].tolist()
+    link_labels = [
+        f"{SENTIMENT_BUCKETS[i]} → {SENTIMENT_BUCKETS[j]}: {(count / total_calls) * 100:.1f}% ({count} calls)"
+        for i, j, count in zip(start_idx, end_idx, values)
+    ]
+    
+    # Whole spec as one dict - validated once by the Figure constructor
+    return go.Figure({
+        'data': [{
+            'type': 'sankey',
+            'node': {
+                'pad': 20,
+                'thickness': 25,
+                'line': {'color': 'white', 'width': 2},
+                'label': NODE_LABELS,
+                'color': NODE_COLORS,
+                'hovertemplate': '%{label}<br>%{value} calls<extra></extra>',
+            },
+            'link': {
+                'source': sources,
+                'target': targets,
+                'value': values,
+                'color': link_colors,
+                'hovertemplate': '%{label}<extra></extra>',
+                'label': link_labels,
+            },
+        }],
+        'layout': SANKEY_LAYOUT,
+    }, skip_invalid=True)
 
 
 def calculate_sentiment_summary(df: pd.DataFrame) -> Dict:
@@ -165,46 +161,42 @@ def calculate_sentiment_summary(df: pd.DataFrame) -> Dict:
             - declining_by_agent: Top agents for declining calls
     """
     
-    # Classify each call
-    df = df.copy()
-    df['delta'] = df['sentiment_end'] - df['sentiment_start']
+    # Classify each call: 0 = declining (< -0.2), 1 = stable, 2 = improving (> 0.2)
+    s_start = df['sentiment_start'].to_numpy()
+    s_end = df['sentiment_end'].to_numpy()
+    delta = s_end - s_start
     
-    improving = (df['delta'] > 0.2).sum()
-    stable = ((df['delta'] >= -0.2) & (df['delta'] <= 0.2)).sum()
-    declining = (df['delta'] < -0.2).sum()
+    trend_codes = (delta >= -0.2).astype(np.int8) + (delta > 0.2)
+    declining, stable, improving = np.bincount(trend_codes, minlength=3)
     
     total = len(df)
     
-    # Find most common flow
-    def bucket_sentiment(s):
-        if s < -0.3:
-            return 'Negative'
-        elif s < 0.3:
-            return 'Neutral'
-        else:
-            return 'Positive'
-    
-    df['start_bucket'] = df['sentiment_start'].apply(bucket_sentiment)
-    df['end_bucket'] = df['sentiment_end'].apply(bucket_sentiment)
-    df['flow'] = df['start_bucket'] + ' → ' + df['end_bucket']
-    
-    top_flow = df['flow'].value_counts().iloc[0] if len(df) > 0 else 'N/A'
-    top_flow_count = df['flow'].value_counts().iloc[0] if len(df) > 0 else 0
+    # Find most common flow from the 3x3 start/end bucket transition matrix
+    transitions = np.bincount(bucket_codes(s_start) * 3 + bucket_codes(s_end), minlength=9)
+    if total > 0:
+        start_code, end_code = divmod(int(transitions.argmax()), 3)
+        top_flow = f"{SENTIMENT_BUCKETS[start_code]} → {SENTIMENT_BUCKETS[end_code]}"
+        top_flow_count = int(transitions.max())
+    else:
+        top_flow = 'N/A'
+        top_flow_count = 0
     
-    # Breakdown declining calls
-    declining_calls = df[df['delta'] < -0.2]
+    # Breakdown declining calls - mask only the two needed columns, never the whole frame
+    declining_mask = trend_codes == 0
     
-    if len(declining_calls) > 0:
+    if declining > 0:
         # Top topics
-        if 'resolution' in declining_calls.columns:
-            topic_counts = declining_calls['resolution'].apply(lambda x: x.get('issue_category', 'Unknown')).value_counts()
+        if 'issue_category' in df.columns:
+            topic_counts = df['issue_category'][declining_mask].value_counts()
+            topic_counts = topic_counts[topic_counts > 0]
             top_topics = [{'topic': topic, 'count': count} for topic, count in topic_counts.head(3).items()]
         else:
             top_topics = []
         
         # Top agents
-        if 'agent_name' in declining_calls.columns:
-            agent_counts = declining_calls['agent_name'].value_counts()
+        if 'agent_name' in df.columns:
+            agent_counts = df['agent_name'][declining_mask].value_counts()
+            agent_counts = agent_counts[agent_counts > 0]
             top_agents = [{'agent': agent, 'count': count} for agent, count in agent_counts.head(3).items()]
         else:
             top_agents = []
@@ -6,7 +6,8 @@ Generuje realistické volania s STT transkriptmi a AutoQA výstupmi
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Literal
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Literal
 import random
 
 
@@ -58,6 +59,16 @@ CUSTOMER_PHRASES_EN = [
     "Thank you", "That's great", "Finally", "This is complicated",
 ]
 
+# Kód speakera v SoA segmentoch = index
+SPEAKER_NAMES = ("AGENT", "CUSTOMER")
+
+# Jazyk → (agent frázy, customer frázy) ako object polia pre rng.choice
+PHRASES = {
+    "cs": (np.array(CZECH_PHRASES, dtype=object), np.array(CUSTOMER_PHRASES_CS, dtype=object)),
+    "sk": (np.array(SLOVAK_PHRASES, dtype=object), np.array(CUSTOMER_PHRASES_SK, dtype=object)),
+    "en": (np.array(ENGLISH_PHRASES, dtype=object), np.array(CUSTOMER_PHRASES_EN, dtype=object)),
+}
+
 TOPICS = {
     "billing": {"complexity": 2, "avg_duration": 240, "sentiment_start": -0.3},
     "technical": {"complexity": 4, "avg_duration": 480, "sentiment_start": -0.5},
@@ -67,8 +78,29 @@ TOPICS = {
     "order": {"complexity": 3, "avg_duration": 270, "sentiment_start": 0.1},
 }
 
+# TOPICS ako paralelné polia indexované kódom topicu (poradie podľa TOPICS)
+TOPIC_NAMES = np.array(list(TOPICS), dtype=object)
+TOPIC_COMPLEXITY = np.array([TOPICS[t]["complexity"] for t in TOPIC_NAMES])
+TOPIC_AVG_DURATION = np.array([TOPICS[t]["avg_duration"] for t in TOPIC_NAMES], dtype=float)
+TOPIC_SENTIMENT_START = np.array([TOPICS[t]["sentiment_start"] for t in TOPIC_NAMES])
+
 TEAMS = ["Sales", "Support", "Tech", "Retention"]
 
+# AutoQA hodnotenie scriptu / call control: váhy podľa toho, či bol hovor plne vyriešený
+SCRIPT_OPTIONS = np.array(["good", "partial", "poor"], dtype=object)
+SCRIPT_WEIGHTS_FULL = [0.7, 0.25, 0.05]
+SCRIPT_WEIGHTS_OTHER = [0.4, 0.4, 0.2]
+
+INTENTS = np.array(["get_information", "resolve_problem", "make_complaint", "request_service"], dtype=object)
+INTENT_WEIGHTS = {
+    "billing": [0.3, 0.5, 0.15, 0.05],
+    "technical": [0.2, 0.7, 0.05, 0.05],
+    "product_info": [0.8, 0.1, 0.05, 0.05],
+    "complaint": [0.1, 0.3, 0.6, 0.0],
+    "account": [0.4, 0.4, 0.1, 0.1],
+    "order": [0.5, 0.2, 0.1, 0.2],
+}
+
 
 # ============================================================================
 # DATA GENERATION FUNCTIONS
@@ -102,41 +134,37 @@ def generate_transcript_segments(
     duration_sec: float,
     language: str,
     topic: str,
-    simulate_interruptions: bool = False
-) -> List[Dict]:
-    """Generuje transkript segmenty pre jeden hovor"""
-    
-    if language == "cs":
-        agent_phrases = CZECH_PHRASES
-        customer_phrases = CUSTOMER_PHRASES_CS
-    elif language == "sk":
-        agent_phrases = SLOVAK_PHRASES
-        customer_phrases = CUSTOMER_PHRASES_SK
-    else:
-        agent_phrases = ENGLISH_PHRASES
-        customer_phrases = CUSTOMER_PHRASES_EN
+    simulate_interruptions: bool = False,
+    rng: Optional[np.random.Generator] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Generuje transkript segmenty pre jeden hovor.
     
-    segments = []
-    current_time = 0.0
-    speaker = "AGENT"  # začína agent
+    Returns:
+        Segmenty ako dict paralelných polí (SoA): speaker (kód do SPEAKER_NAMES),
+        text, start_time, end_time, word_count. Zoznam dictov z neho robí
+        segments_to_dicts.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    agent_phrases, customer_phrases = PHRASES.get(language, PHRASES["en"])
     
     # Počet segmentov závisí od dĺžky
     n_segments = int(duration_sec / 15) + random.randint(2, 6)
     
-    for i in range(n_segments):
+    # Frázy sa ťahajú naraz - párne segmenty hovorí customer, nepárne agent
+    customer_texts = rng.choice(customer_phrases, size=(n_segments + 1) // 2)
+    agent_texts = rng.choice(agent_phrases, size=n_segments // 2)
+    
+    starts = []
+    ends = []
+    current_time = 0.0
+    
+    for _ in range(n_segments):
         if current_time >= duration_sec:
             break
         
-        # Alternovanie speakerov
-        speaker = "CUSTOMER" if speaker == "AGENT" else "AGENT"
-        
-        # Vyber frázu
-        if speaker == "AGENT":
-            text = random.choice(agent_phrases)
-        else:
-            text = random.choice(customer_phrases)
-        
-        word_count = len(text.split())
         # Priemerná dĺžka segmentu 3-8 sekúnd
         segment_duration = random.uniform(3, 8)
         
@@ -149,39 +177,89 @@ def generate_transcript_segments(
             overlap = random.uniform(0.2, 0.8)
             start_time = max(0, start_time - overlap)
         
-        segments.append({
-            "speaker": speaker,
-            "text": text,
-            "start_time": round(start_time, 2),
-            "end_time": round(end_time, 2),
-            "word_count": word_count,
-        })
+        starts.append(round(start_time, 2))
+        ends.append(round(end_time, 2))
         
         # Pauza medzi segmentami (0.5-2 sekundy)
         current_time = end_time + random.uniform(0.5, 2)
     
-    return segments
+    n = len(starts)
+    texts = np.empty(n, dtype=object)
+    texts[0::2] = customer_texts[:(n + 1) // 2]
+    texts[1::2] = agent_texts[:n // 2]
+    
+    return {
+        # Alternovanie speakerov: prvý hovorí customer
+        "speaker": (np.arange(n) % 2 == 0).astype(np.int8),
+        "text": texts,
+        "start_time": np.array(starts, dtype=float),
+        "end_time": np.array(ends, dtype=float),
+        "word_count": np.fromiter((len(t.split()) for t in texts), dtype=np.int16, count=n),
+    }
 
 
-def detect_silences(segments: List[Dict], duration_sec: float) -> Tuple[List[Dict], float]:
-    """Detekuje ticho medzi segmentami"""
-    silences = []
-    
-    sorted_segs = sorted(segments, key=lambda x: x["start_time"])
+def segments_to_dicts(segments: Dict[str, np.ndarray]) -> List[Dict]:
+    """Prevedie SoA segmenty na zoznam dictov (pre UI a detect_* funkcie)"""
+    return [
+        {
+            "speaker": SPEAKER_NAMES[speaker],
+            "text": text,
+            "start_time": start_time,
+            "end_time": end_time,
+            "word_count": word_count,
+        }
+        for speaker, text, start_time, end_time, word_count in zip(
+            segments["speaker"].tolist(),
+            segments["text"].tolist(),
+            segments["start_time"].tolist(),
+            segments["end_time"].tolist(),
+            segments["word_count"].tolist(),
+        )
+    ]
+
+
+def _segment_bounds(segments: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Start/end časy segmentov ako NumPy polia.
     
-    for i in range(len(sorted_segs) - 1):
-        gap_start = sorted_segs[i]["end_time"]
-        gap_end = sorted_segs[i + 1]["start_time"]
-        gap_duration = gap_end - gap_start
-        
-        if gap_duration > 3:  # pause threshold
-            silence_type = "hold" if gap_duration > 10 else "pause"
-            silences.append({
-                "start": round(gap_start, 2),
-                "end": round(gap_end, 2),
-                "duration": round(gap_duration, 2),
-                "type": silence_type,
-            })
+    Segmenty musia byť zoradené podľa start_time. generate_transcript_segments
+    to garantuje aj s interrupciami: posun späť je max 0.8s, pauza min 0.5s
+    a segment (okrem orezaného posledného) trvá min 3s.
+    """
+    n = len(segments)
+    starts = np.fromiter((s["start_time"] for s in segments), dtype=float, count=n)
+    ends = np.fromiter((s["end_time"] for s in segments), dtype=float, count=n)
+    return starts, ends
+
+
+def detect_silences(segments: List[Dict], duration_sec: float) -> Tuple[List[Dict], float]:
+    """Detekuje ticho medzi segmentami (segmenty zoradené podľa start_time)"""
+    starts, ends = _segment_bounds(segments)
+    return _silences_from_bounds(starts, ends, duration_sec)
+
+
+def _silences_from_bounds(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    duration_sec: float
+) -> Tuple[List[Dict], float]:
+    """Ticho medzi segmentami zo zoradených start/end polí"""
+    gap_starts = ends[:-1]
+    gap_ends = starts[1:]
+    gaps = gap_ends - gap_starts
+    idx = np.flatnonzero(gaps > 3)  # pause threshold
+    
+    silences = [
+        {
+            "start": round(gap_start, 2),
+            "end": round(gap_end, 2),
+            "duration": round(gap_duration, 2),
+            "type": "hold" if gap_duration > 10 else "pause",
+        }
+        for gap_start, gap_end, gap_duration in zip(
+            gap_starts[idx].tolist(), gap_ends[idx].tolist(), gaps[idx].tolist()
+        )
+    ]
     
     total_silence = sum(s["duration"] for s in silences)
     silence_ratio = round(total_silence / duration_sec, 3) if duration_sec > 0 else 0.0
@@ -190,23 +268,50 @@ def detect_silences(segments: List[Dict], duration_sec: float) -> Tuple[List[Dic
 
 
 def detect_interruptions(segments: List[Dict]) -> List[Dict]:
-    """Detekuje prerušenia (overlapping segments)"""
-    interruptions = []
-    sorted_segs = sorted(segments, key=lambda x: x["start_time"])
+    """Detekuje prerušenia (overlapping segments, zoradené podľa start_time)"""
+    starts, ends = _segment_bounds(segments)
+    
+    # Overlap = next začína pred koncom current
+    idx = np.flatnonzero(starts[1:] < ends[:-1])
+    
+    return [
+        {
+            "time": round(segments[i + 1]["start_time"], 2),
+            "interrupter": segments[i + 1]["speaker"],
+            "interrupted": segments[i]["speaker"],
+        }
+        for i in idx.tolist()
+    ]
+
+
+def compute_call_stats(
+    segments: Dict[str, np.ndarray],
+    duration_sec: float,
+    detect_overlaps: bool = False
+) -> Tuple[float, float, float, int]:
+    """
+    Per-call štatistiky transkriptu priamo nad SoA poliami segmentov.
     
-    for i in range(len(sorted_segs) - 1):
-        current = sorted_segs[i]
-        next_seg = sorted_segs[i + 1]
+    Args:
+        segments: SoA segmenty z generate_transcript_segments
+        duration_sec: Dĺžka hovoru
+        detect_overlaps: Či počítať prerušenia (len pri simulate_interruptions)
         
-        # Overlap = next začína pred koncom current
-        if next_seg["start_time"] < current["end_time"]:
-            interruptions.append({
-                "time": round(next_seg["start_time"], 2),
-                "interrupter": next_seg["speaker"],
-                "interrupted": current["speaker"],
-            })
+    Returns:
+        (agent_talk_sec, customer_talk_sec, silence_ratio, interrupt_count)
+    """
+    starts = segments["start_time"]
+    ends = segments["end_time"]
+    is_agent = segments["speaker"] == SPEAKER_NAMES.index("AGENT")
+    
+    talk = ends - starts
+    agent_talk_sec = float(talk[is_agent].sum())
+    customer_talk_sec = float(talk[~is_agent].sum())
+    
+    _, silence_ratio = _silences_from_bounds(starts, ends, duration_sec)
+    interrupt_count = int(np.count_nonzero(starts[1:] < ends[:-1])) if detect_overlaps else 0
     
-    return interruptions
+    return agent_talk_sec, customer_talk_sec, silence_ratio, interrupt_count
 
 
 def generate_autoqa_compliance(topic: str, language: str) -> Dict:
@@ -269,8 +374,18 @@ def generate_autoqa_resolution(topic: str) -> Dict:
     }
 
 
-def generate_autoqa_quality(topic: str, resolution: Dict) -> Dict:
-    """Syntetické AutoQA quality polia"""
+def generate_autoqa_quality(
+    topic: str,
+    resolution: Dict,
+    script_adherence: Optional[str] = None,
+    call_control: Optional[str] = None
+) -> Dict:
+    """
+    Syntetické AutoQA quality polia.
+    
+    script_adherence / call_control môžu prísť predťahané z generate_dataset
+    (podľa váh pre daný resolution), inak sa ťahajú tu.
+    """
     
     # Kvalita koreluje s resolution
     base_prob = 0.85 if resolution["resolution_achieved"] == "full" else 0.6
@@ -283,10 +398,13 @@ def generate_autoqa_quality(topic: str, resolution: Dict) -> Dict:
         "customer_name_used": random.random() < 0.5,
     }
     
-    script_options = ["good", "partial", "poor"]
-    weights = [0.7, 0.25, 0.05] if base_prob > 0.7 else [0.4, 0.4, 0.2]
-    quality["script_adherence"] = random.choices(script_options, weights=weights)[0]
-    quality["call_control"] = random.choices(script_options, weights=weights)[0]
+    weights = SCRIPT_WEIGHTS_FULL if base_prob > 0.7 else SCRIPT_WEIGHTS_OTHER
+    if script_adherence is None:
+        script_adherence = random.choices(SCRIPT_OPTIONS, weights=weights)[0]
+    if call_control is None:
+        call_control = random.choices(SCRIPT_OPTIONS, weights=weights)[0]
+    quality["script_adherence"] = script_adherence
+    quality["call_control"] = call_control
     
     positive_moments = []
     negative_moments = []
@@ -307,8 +425,8 @@ def generate_autoqa_quality(topic: str, resolution: Dict) -> Dict:
     return quality
 
 
-def generate_autoqa_topic(topic: str, language: str) -> Dict:
-    """Syntetické AutoQA topic polia"""
+def generate_autoqa_topic(topic: str, language: str, customer_intent: Optional[str] = None) -> Dict:
+    """Syntetické AutoQA topic polia (customer_intent môže prísť predťahaný)"""
     
     sub_topics_map = {
         "billing": ["invoice", "payment", "charges"],
@@ -319,20 +437,13 @@ def generate_autoqa_topic(topic: str, language: str) -> Dict:
         "order": ["status", "delivery", "cancellation"],
     }
     
-    intents = ["get_information", "resolve_problem", "make_complaint", "request_service"]
-    intent_weights = {
-        "billing": [0.3, 0.5, 0.15, 0.05],
-        "technical": [0.2, 0.7, 0.05, 0.05],
-        "product_info": [0.8, 0.1, 0.05, 0.05],
-        "complaint": [0.1, 0.3, 0.6, 0.0],
-        "account": [0.4, 0.4, 0.1, 0.1],
-        "order": [0.5, 0.2, 0.1, 0.2],
-    }
+    if customer_intent is None:
+        customer_intent = random.choices(INTENTS, weights=INTENT_WEIGHTS[topic])[0]
     
     return {
         "primary_topic": topic,
         "sub_topics": random.sample(sub_topics_map[topic], k=random.randint(1, 2)),
-        "customer_intent": random.choices(intents, weights=intent_weights[topic])[0],
+        "customer_intent": customer_intent,
         "topic_complexity": TOPICS[topic]["complexity"],
         "keywords": [topic, language],
     }
@@ -370,115 +481,175 @@ def generate_dataset(
     """
     Hlavná funkcia na generovanie datasetu.
     
+    Výstup je memoizovaný na parametroch (generovanie je pre daný seed
+    deterministické), takže opakované volanie vráti tie isté objekty -
+    volajúci ich nesmú mutovať.
+    
     Returns:
         calls_df: DataFrame s hovormi
-        transcripts: Dict[call_id] -> List[segments]
+        transcripts: Dict[call_id] -> SoA segmenty (zoznam dictov cez get_transcript_for_call)
         agents_df: DataFrame s agentmi
     """
+    return _generate_dataset_cached(int(n_calls), int(n_agents), int(seed), bool(simulate_interruptions))
+
+
+@lru_cache(maxsize=4)
+def _generate_dataset_cached(
+    n_calls: int,
+    n_agents: int,
+    seed: int,
+    simulate_interruptions: bool
+) -> Tuple[pd.DataFrame, Dict, pd.DataFrame]:
+    """Generuje dataset (memoizované cez generate_dataset)"""
     np.random.seed(seed)
     random.seed(seed)
+    rng = np.random.default_rng(seed)
     
     agents_df = generate_agents(n_agents, seed)
     
-    calls = []
     transcripts = {}
     
     # Časový rozsah: posledných 30 dní
     end_date = datetime.now()
     start_date = end_date - timedelta(days=30)
+    total_seconds = int((end_date - start_date).total_seconds())
+    
+    # Per-call náhodné hodnoty sa ťahajú naraz ako polia; slučka ostáva
+    # len na skladanie transkriptu a AutoQA výstupov
+    offsets_sec = rng.integers(0, total_seconds, size=n_calls, endpoint=True).tolist()
+    directions = rng.choice(["INBOUND", "OUTBOUND"], size=n_calls, p=[0.8, 0.2]).tolist()
+    # Language: 70% cs/sk, 30% en
+    languages = rng.choice(["cs", "sk", "en"], size=n_calls, p=[0.4, 0.3, 0.3]).tolist()
+    agent_idx = rng.integers(0, len(agents_df), size=n_calls)
+    agent_ids = agents_df["agent_id"].to_numpy()[agent_idx].tolist()
+    agent_names = agents_df["agent_name"].to_numpy()[agent_idx].tolist()
+    agent_teams = agents_df["team"].to_numpy()[agent_idx].tolist()
+    topic_codes = rng.integers(0, len(TOPIC_NAMES), size=n_calls)
+    topics = TOPIC_NAMES[topic_codes].tolist()
+    
+    # Duration: podľa topicu + variancia
+    base_durations = TOPIC_AVG_DURATION[topic_codes]
+    durations = np.clip(rng.normal(base_durations, base_durations * 0.3), 60, None).round(1).tolist()
+    
+    # AutoQA kategórie: script/call control pre obe váhové skupiny (výber podľa
+    # resolution v slučke), intent jedným ťahom na topic
+    script_draws = {
+        True: rng.choice(SCRIPT_OPTIONS, size=(2, n_calls), p=SCRIPT_WEIGHTS_FULL),
+        False: rng.choice(SCRIPT_OPTIONS, size=(2, n_calls), p=SCRIPT_WEIGHTS_OTHER),
+    }
+    intents = np.empty(n_calls, dtype=object)
+    for code, topic_name in enumerate(TOPIC_NAMES):
+        mask = topic_codes == code
+        intents[mask] = rng.choice(INTENTS, size=np.count_nonzero(mask), p=INTENT_WEIGHTS[topic_name])
+    
+    # Výstupné stĺpce sa plnia po indexe a DataFrame sa skladá priamo z nich
+    call_ids = [f"CALL-{10000+i}" for i in range(n_calls)]
+    agent_talk_out = np.empty(n_calls)
+    customer_talk_out = np.empty(n_calls)
+    turns_out = np.empty(n_calls, dtype=np.int64)
+    silence_ratio_out = np.empty(n_calls)
+    interrupt_count_out = np.empty(n_calls, dtype=np.int64)
+    sentiment_out = np.empty((3, n_calls))
+    compliance_out = np.empty(n_calls, dtype=object)
+    resolution_out = np.empty(n_calls, dtype=object)
+    quality_out = np.empty(n_calls, dtype=object)
+    topic_data_out = np.empty(n_calls, dtype=object)
     
     for i in range(n_calls):
-        call_id = f"CALL-{10000+i}"
-        
-        # Random timestamp
-        random_seconds = random.randint(0, int((end_date - start_date).total_seconds()))
-        timestamp = start_date + timedelta(seconds=random_seconds)
-        
-        # Direction
-        direction = random.choices(["INBOUND", "OUTBOUND"], weights=[0.8, 0.2])[0]
-        
-        # Language: 70% cs/sk, 30% en
-        language = random.choices(["cs", "sk", "en"], weights=[0.4, 0.3, 0.3])[0]
-        
-        # Agent
-        agent = agents_df.sample(1).iloc[0]
-        agent_id = agent["agent_id"]
-        agent_name = agent["agent_name"]
-        team = agent["team"]
-        
-        # Topic
-        topic = random.choice(list(TOPICS.keys()))
-        
-        # Duration: podľa topicu + variancia
-        base_duration = TOPICS[topic]["avg_duration"]
-        duration_sec = max(60, random.gauss(base_duration, base_duration * 0.3))
-        duration_sec = round(duration_sec, 1)
+        language = languages[i]
+        topic = topics[i]
+        duration_sec = durations[i]
         
         # Generate transcript
-        segments = generate_transcript_segments(duration_sec, language, topic, simulate_interruptions)
-        transcripts[call_id] = segments
+        segments = generate_transcript_segments(duration_sec, language, topic, simulate_interruptions, rng)
+        transcripts[call_ids[i]] = segments
         
-        # Calculate speaking times
-        agent_segments = [s for s in segments if s["speaker"] == "AGENT"]
-        customer_segments = [s for s in segments if s["speaker"] == "CUSTOMER"]
-        
-        agent_talk_sec = sum(s["end_time"] - s["start_time"] for s in agent_segments)
-        customer_talk_sec = sum(s["end_time"] - s["start_time"] for s in customer_segments)
-        
-        turns = len(segments)
-        
-        # Silence detection
-        silence_periods, silence_ratio = detect_silences(segments, duration_sec)
-        
-        # Interruption detection
-        interruptions = detect_interruptions(segments) if simulate_interruptions else []
-        interrupt_count = len(interruptions)
+        # Speaking times, silence & interruptions v jednom prechode
+        agent_talk_sec, customer_talk_sec, silence_ratio, interrupt_count = compute_call_stats(
+            segments, duration_sec, simulate_interruptions
+        )
+        agent_talk_out[i] = round(agent_talk_sec, 1)
+        customer_talk_out[i] = round(customer_talk_sec, 1)
+        turns_out[i] = len(segments["start_time"])
+        silence_ratio_out[i] = silence_ratio
+        interrupt_count_out[i] = interrupt_count
         
         # AutoQA outputs
-        compliance = generate_autoqa_compliance(topic, language)
+        compliance_out[i] = generate_autoqa_compliance(topic, language)
         resolution = generate_autoqa_resolution(topic)
-        quality = generate_autoqa_quality(topic, resolution)
-        topic_data = generate_autoqa_topic(topic, language)
-        sentiment_start, sentiment_middle, sentiment_end = generate_sentiment_journey(topic, resolution)
-        
-        call_record = {
-            "call_id": call_id,
-            "timestamp": timestamp,
-            "direction": direction,
-            "language": language,
-            "agent_id": agent_id,
-            "agent_name": agent_name,
-            "team": team,
-            "duration_sec": duration_sec,
-            "agent_talk_sec": round(agent_talk_sec, 1),
-            "customer_talk_sec": round(customer_talk_sec, 1),
-            "turns": turns,
-            "silence_ratio": silence_ratio,
-            "interrupt_count": interrupt_count,
-            "sentiment_start": sentiment_start,
-            "sentiment_middle": sentiment_middle,
-            "sentiment_end": sentiment_end,
-            # Store jako JSON/dict columns
-            "compliance": compliance,
-            "resolution": resolution,
-            "quality": quality,
-            "topic_data": topic_data,
-        }
-        
-        calls.append(call_record)
-    
-    calls_df = pd.DataFrame(calls)
+        resolution_out[i] = resolution
+        script = script_draws[resolution["resolution_achieved"] == "full"]
+        quality_out[i] = generate_autoqa_quality(topic, resolution, script[0, i], script[1, i])
+        topic_data_out[i] = generate_autoqa_topic(topic, language, intents[i])
+        sentiment_out[:, i] = generate_sentiment_journey(topic, resolution)
+    
+    calls_df = pd.DataFrame({
+        "call_id": call_ids,
+        "timestamp": np.datetime64(start_date, "us") + np.array(offsets_sec, dtype="timedelta64[s]"),
+        "direction": directions,
+        "language": languages,
+        "agent_id": agent_ids,
+        "agent_name": agent_names,
+        "team": agent_teams,
+        "duration_sec": durations,
+        "agent_talk_sec": agent_talk_out,
+        "customer_talk_sec": customer_talk_out,
+        "turns": turns_out,
+        "silence_ratio": silence_ratio_out,
+        "interrupt_count": interrupt_count_out,
+        "sentiment_start": sentiment_out[0],
+        "sentiment_middle": sentiment_out[1],
+        "sentiment_end": sentiment_out[2],
+        # Flat copy of resolution["issue_category"] for column-wise topic filters/groupbys
+        "issue_category": topics,
+        # Store jako JSON/dict columns
+        "compliance": compliance_out,
+        "resolution": resolution_out,
+        "quality": quality_out,
+        "topic_data": topic_data_out,
+    })
     
     return calls_df, transcripts, agents_df
 
 
+# Stĺpce s nízkou kardinalitou → category, merania bez prahových porovnaní → float32
+CATEGORY_COLUMNS = ("direction", "language", "agent_id", "agent_name", "team", "issue_category")
+FLOAT32_COLUMNS = ("agent_talk_sec", "customer_talk_sec", "silence_ratio")
+INTEGER_COLUMNS = ("turns", "interrupt_count")
+
+
+def compact_dtypes(calls_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Zmenší dtypes calls DataFrame (raz pri načítaní datasetu).
+    
+    Sentiment, score a duration_sec ostávajú float64 - porovnávajú sa s prahmi
+    alebo sa ich priemery zaokrúhľujú na zobrazenie (AHT, TRE) a float32
+    by posunul hraničné hodnoty.
+    
+    Args:
+        calls_df: DataFrame z generate_dataset
+        
+    Returns:
+        Nový DataFrame s category / float32 / downcast int stĺpcami
+    """
+    calls_df = calls_df.copy()
+    for col in CATEGORY_COLUMNS:
+        calls_df[col] = calls_df[col].astype("category")
+    for col in FLOAT32_COLUMNS:
+        calls_df[col] = calls_df[col].astype(np.float32)
+    for col in INTEGER_COLUMNS:
+        calls_df[col] = pd.to_numeric(calls_df[col], downcast="integer")
+    return calls_df
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
 def get_transcript_for_call(call_id: str, transcripts: Dict) -> List[Dict]:
-    """Získa transkript pre daný call_id"""
-    return transcripts.get(call_id, [])
+    """Získa transkript pre daný call_id (dicty segmentov sa tvoria až tu)"""
+    segments = transcripts.get(call_id)
+    return segments_to_dicts(segments) if segments is not None else []
 
 
 def calculate_speaking_rate(segments: List[Dict], speaker: str) -> float:
@@ -6,7 +6,7 @@ Shows topic performance: AHT vs Volume with AES as bubble size
 import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 
 COLORS = {
@@ -16,8 +16,40 @@ COLORS = {
     'critical': '#EF5350',
 }
 
+# SVG scatter is faster below ~1000 points; WebGL (Scattergl) wins above that
+SCATTERGL_MIN_POINTS = 1000
 
-def create_efficiency_bubble_chart(df: pd.DataFrame) -> go.Figure:
+
+def aggregate_topic_stats(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Per-topic volume, AHT and AES in a single groupby pass.
+    
+    Args:
+        df: DataFrame with issue_category, duration_sec and (optionally) aes columns
+        
+    Returns:
+        DataFrame with topic, volume, aht (minutes), aes - one row per observed topic
+    """
+    grouped = df.groupby('issue_category', observed=True)
+    
+    df_topics = pd.DataFrame({
+        'volume': grouped.size(),
+        'aht': grouped['duration_sec'].mean() / 60,  # Convert to minutes
+    })
+    df_topics['aes'] = grouped['aes'].mean() if 'aes' in df.columns else 70
+    
+    df_topics.index = df_topics.index.astype(object)
+    return df_topics.rename_axis('topic').reset_index()
+
+
+def _topic_stats_copy(df: pd.DataFrame, topic_stats: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """Own copy of the topic stats (callers add display columns), aggregated only if not passed in."""
+    if topic_stats is None:
+        return aggregate_topic_stats(df)
+    return topic_stats.copy()
+
+
+def create_efficiency_bubble_chart(df: pd.DataFrame, topic_stats: Optional[pd.DataFrame] = None) -> go.Figure:
     """
     Creates bubble chart showing topic efficiency.
     
@@ -28,25 +60,15 @@ def create_efficiency_bubble_chart(df: pd.DataFrame) -> go.Figure:
     
     Args:
         df: DataFrame with calls
+        topic_stats: Precomputed aggregate_topic_stats(df), shared with get_efficiency_insights
         
     Returns:
         Plotly scatter plot with bubbles
     """
     
     # Aggregate by topic
-    topic_stats = []
-    
-    for topic, group in df.groupby(df['resolution'].apply(lambda x: x.get('issue_category', 'Unknown'))):
-        stats = {
-            'topic': topic,
-            'volume': len(group),
-            'volume_pct': (len(group) / len(df)) * 100,
-            'aht': group['duration_sec'].mean() / 60,  # Convert to minutes
-            'aes': group['aes'].mean() if 'aes' in group.columns else 70
-        }
-        topic_stats.append(stats)
-    
-    df_topics = pd.DataFrame(topic_stats)
+    df_topics = _topic_stats_copy(df, topic_stats)
+    df_topics['volume_pct'] = (df_topics['volume'] / len(df)) * 100
     
     # Sort by volume
     df_topics = df_topics.sort_values('volume', ascending=False)
@@ -58,54 +80,74 @@ def create_efficiency_bubble_chart(df: pd.DataFrame) -> go.Figure:
     median_aht = df_topics['aht'].median()
     median_aes = df_topics['aes'].median()
     
-    colors = []
-    labels = []
-    
-    for _, row in df_topics.iterrows():
-        if row['aes'] >= median_aes and row['aht'] <= median_aht:
-            colors.append(COLORS['excellent'])
-            labels.append('⭐ High Efficiency')
-        elif row['aes'] >= median_aes and row['aht'] > median_aht:
-            colors.append(COLORS['good'])
-            labels.append('✅ Good AES, Slow')
-        elif row['aes'] < median_aes and row['aht'] <= median_aht:
-            colors.append(COLORS['warning'])
-            labels.append('⚠️ Fast but Low Quality')
-        else:
-            colors.append(COLORS['critical'])
-            labels.append('🔴 Needs Improvement')
-    
-    df_topics['color'] = colors
-    df_topics['label'] = labels
+    hi_aes = df_topics['aes'] >= median_aes
+    lo_aht = df_topics['aht'] <= median_aht
+    quadrants = [hi_aes & lo_aht, hi_aes & ~lo_aht, ~hi_aes & lo_aht]
+    
+    df_topics['color'] = np.select(
+        quadrants,
+        [COLORS['excellent'], COLORS['good'], COLORS['warning']],
+        default=COLORS['critical']
+    )
+    df_topics['label'] = np.select(
+        quadrants,
+        ['⭐ High Efficiency', '✅ Good AES, Slow', '⚠️ Fast but Low Quality'],
+        default='🔴 Needs Improvement'
+    )
     
     # Create bubble chart
     fig = go.Figure()
     
     # Add bubbles
-    fig.add_trace(go.Scatter(
-        x=df_topics['aht'],
-        y=df_topics['volume_pct'],
-        mode='markers+text',
-        marker=dict(
-            size=df_topics['aes'],
-            sizemode='diameter',
-            sizeref=2,
-            color=df_topics['color'],
-            line=dict(width=2, color='white'),
-            opacity=0.8
-        ),
-        text=df_topics['topic'],
-        textposition='top center',
-        textfont=dict(size=10, family='Inter'),
-        hovertemplate=(
-            '<b>%{text}</b><br>' +
-            'AHT: %{x:.1f} min<br>' +
-            'Volume: %{y:.1f}%<br>' +
-            'AES: %{marker.size:.1f}<br>' +
-            '<extra></extra>'
-        ),
-        showlegend=False
-    ))
+    marker = dict(
+        size=df_topics['aes'],
+        sizemode='diameter',
+        sizeref=2,
+        color=df_topics['color'],
+        line=dict(width=2, color='white'),
+        opacity=0.8
+    )
+    hovertemplate = (
+        '<b>%{text}</b><br>' +
+        'AHT: %{x:.1f} min<br>' +
+        'Volume: %{y:.1f}%<br>' +
+        'AES: %{marker.size:.1f}<br>' +
+        '<extra></extra>'
+    )
+    
+    if len(df_topics) >= SCATTERGL_MIN_POINTS:
+        # WebGL markers + a light SVG text-only overlay for the labels
+        fig.add_trace(go.Scattergl(
+            x=df_topics['aht'],
+            y=df_topics['volume_pct'],
+            mode='markers',
+            marker=marker,
+            text=df_topics['topic'],
+            hovertemplate=hovertemplate,
+            showlegend=False
+        ))
+        fig.add_trace(go.Scatter(
+            x=df_topics['aht'],
+            y=df_topics['volume_pct'],
+            mode='text',
+            text=df_topics['topic'],
+            textposition='top center',
+            textfont=dict(size=10, family='Inter'),
+            hoverinfo='skip',
+            showlegend=False
+        ))
+    else:
+        fig.add_trace(go.Scatter(
+            x=df_topics['aht'],
+            y=df_topics['volume_pct'],
+            mode='markers+text',
+            marker=marker,
+            text=df_topics['topic'],
+            textposition='top center',
+            textfont=dict(size=10, family='Inter'),
+            hovertemplate=hovertemplate,
+            showlegend=False
+        ))
     
     # Add reference lines (median)
     fig.add_vline(
@@ -148,31 +190,22 @@ def create_efficiency_bubble_chart(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
-def get_efficiency_insights(df: pd.DataFrame) -> Dict:
+def get_efficiency_insights(df: pd.DataFrame, topic_stats: Optional[pd.DataFrame] = None) -> Dict:
     """
     Analyzes efficiency patterns and returns insights.
     
+    Args:
+        df: DataFrame with calls
+        topic_stats: Precomputed aggregate_topic_stats(df), shared with the bubble chart
+        
     Returns:
         Dict with top performers and improvement areas
     """
     
     # Aggregate by topic
-    topic_stats = []
-    
-    for topic, group in df.groupby(df['resolution'].apply(lambda x: x.get('issue_category', 'Unknown'))):
-        stats = {
-            'topic': topic,
-            'volume': len(group),
-            'aht': group['duration_sec'].mean() / 60,
-            'aes': group['aes'].mean() if 'aes' in group.columns else 70,
-            'efficiency_score': 0  # Will calculate
-        }
-        # Efficiency = High AES / Low AHT
-        # Normalize: (AES / 100) / (AHT / median_aht)
-        stats['efficiency_score'] = stats['aes'] / stats['aht']
-        topic_stats.append(stats)
-    
-    df_topics = pd.DataFrame(topic_stats)
+    df_topics = _topic_stats_copy(df, topic_stats)
+    # Efficiency = High AES / Low AHT
+    df_topics['efficiency_score'] = df_topics['aes'] / df_topics['aht']
     df_topics = df_topics.sort_values('efficiency_score', ascending=False)
     
     # Top 3 performers
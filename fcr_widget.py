@@ -4,8 +4,8 @@ Shows FCR from two perspectives: Agent notes vs Computed data
 """
 
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import pandas as pd
+import numpy as np
 from typing import Dict
 
 
@@ -16,6 +16,59 @@ COLORS = {
     'critical': '#EF5350',
 }
 
+# FCR target (delta reference + threshold line) and gauge background bands
+FCR_TARGET = 70
+
+FCR_GAUGE_STEPS = [
+    {'range': [0, 50], 'color': 'rgba(239, 83, 80, 0.1)'},
+    {'range': [50, 70], 'color': 'rgba(255, 167, 38, 0.1)'},
+    {'range': [70, 100], 'color': 'rgba(0, 200, 83, 0.1)'}
+]
+
+# Shared gauge spec parts (go.Figure copies them, so they are never mutated)
+FCR_GAUGE_AXIS = {'range': [0, 100]}
+FCR_GAUGE_DELTA = {'reference': FCR_TARGET, 'increasing': {'color': COLORS['excellent']}}
+FCR_GAUGE_THRESHOLD = {
+    'line': {'color': COLORS['critical'], 'width': 4},
+    'thickness': 0.75,
+    'value': FCR_TARGET
+}
+FCR_GAUGE_NUMBER = {'suffix': '%', 'font': {'size': 40}}
+
+# Left / right gauge placement with a subplot-style title above each
+FCR_GAUGE_DOMAINS = (
+    {'x': [0.0, 0.45], 'y': [0.0, 1.0]},
+    {'x': [0.55, 1.0], 'y': [0.0, 1.0]},
+)
+
+
+def _gauge_title_annotation(text: str, x: float) -> Dict:
+    """Paper-anchored title above a gauge (same placement make_subplots uses)."""
+    return {
+        'text': text,
+        'x': x, 'y': 1.0,
+        'xref': 'paper', 'yref': 'paper',
+        'xanchor': 'center', 'yanchor': 'bottom',
+        'showarrow': False,
+        'font': {'size': 16},
+    }
+
+
+FCR_GAUGE_LAYOUT = {
+    'annotations': [
+        _gauge_title_annotation('FCR (Agent Notes)', 0.225),
+        _gauge_title_annotation('FCR (Computed - No Callback 48h)', 0.775),
+    ],
+    'height': 300,
+    'margin': {'l': 40, 'r': 40, 't': 60, 'b': 40},
+    'paper_bgcolor': 'white',
+    'font': {'family': 'Inter', 'size': 12},
+}
+
+# FCR color tiers: < 50 critical, < 70 warning, < 80 good, else excellent
+FCR_COLOR_BINS = np.array([50, 70, 80])
+FCR_COLOR_LUT = np.array([COLORS['critical'], COLORS['warning'], COLORS['good'], COLORS['excellent']], dtype=object)
+
 
 def create_fcr_dual_gauge(fcr_agent: float, fcr_computed: float) -> go.Figure:
     """
@@ -29,78 +82,53 @@ def create_fcr_dual_gauge(fcr_agent: float, fcr_computed: float) -> go.Figure:
         Plotly Figure with 2 gauge charts side-by-side
     """
     
-    fig = make_subplots(
-        rows=1, cols=2,
-        specs=[[{'type': 'indicator'}, {'type': 'indicator'}]],
-        subplot_titles=('FCR (Agent Notes)', 'FCR (Computed - No Callback 48h)')
-    )
-    
-    # LEFT: FCR from agent notes
-    fig.add_trace(go.Indicator(
-        mode="gauge+number+delta",
-        value=fcr_agent,
-        delta={'reference': 70, 'increasing': {'color': COLORS['excellent']}},
-        gauge={
-            'axis': {'range': [0, 100]},
-            'bar': {'color': get_fcr_color(fcr_agent)},
-            'steps': [
-                {'range': [0, 50], 'color': 'rgba(239, 83, 80, 0.1)'},
-                {'range': [50, 70], 'color': 'rgba(255, 167, 38, 0.1)'},
-                {'range': [70, 100], 'color': 'rgba(0, 200, 83, 0.1)'}
-            ],
-            'threshold': {
-                'line': {'color': COLORS['critical'], 'width': 4},
-                'thickness': 0.75,
-                'value': 70
-            }
-        },
-        number={'suffix': '%', 'font': {'size': 40}},
-        title={'text': 'Based on resolution annotations', 'font': {'size': 14}}
-    ), row=1, col=1)
-    
-    # RIGHT: FCR computed
-    fig.add_trace(go.Indicator(
-        mode="gauge+number+delta",
-        value=fcr_computed,
-        delta={'reference': 70, 'increasing': {'color': COLORS['excellent']}},
-        gauge={
-            'axis': {'range': [0, 100]},
-            'bar': {'color': get_fcr_color(fcr_computed)},
-            'steps': [
-                {'range': [0, 50], 'color': 'rgba(239, 83, 80, 0.1)'},
-                {'range': [50, 70], 'color': 'rgba(255, 167, 38, 0.1)'},
-                {'range': [70, 100], 'color': 'rgba(0, 200, 83, 0.1)'}
-            ],
-            'threshold': {
-                'line': {'color': COLORS['critical'], 'width': 4},
-                'thickness': 0.75,
-                'value': 70
-            }
+    # Indicators are placed by domain, so the side-by-side layout needs no make_subplots grid
+    return go.Figure({
+        'data': [
+            # LEFT: FCR from agent notes
+            _make_gauge(fcr_agent, 'Based on resolution annotations', FCR_GAUGE_DOMAINS[0]),
+            # RIGHT: FCR computed
+            _make_gauge(fcr_computed, 'No repeat contact within 48 hours', FCR_GAUGE_DOMAINS[1]),
+        ],
+        'layout': FCR_GAUGE_LAYOUT,
+    })
+
+
+def _make_gauge(value: float, title: str, domain: Dict) -> Dict:
+    """Indicator trace spec; only the value, bar color, title and domain vary per gauge."""
+    return {
+        'type': 'indicator',
+        'mode': 'gauge+number+delta',
+        'value': value,
+        'delta': FCR_GAUGE_DELTA,
+        'gauge': {
+            'axis': FCR_GAUGE_AXIS,
+            'bar': {'color': get_fcr_color(value)},
+            'steps': FCR_GAUGE_STEPS,
+            'threshold': FCR_GAUGE_THRESHOLD,
         },
-        number={'suffix': '%', 'font': {'size': 40}},
-        title={'text': 'No repeat contact within 48 hours', 'font': {'size': 14}}
-    ), row=1, col=2)
-    
-    fig.update_layout(
-        height=300,
-        margin=dict(l=40, r=40, t=60, b=40),
-        paper_bgcolor='white',
-        font=dict(family='Inter', size=12)
-    )
-    
-    return fig
+        'number': FCR_GAUGE_NUMBER,
+        'title': {'text': title, 'font': {'size': 14}},
+        'domain': domain,
+    }
 
 
 def get_fcr_color(fcr_value: float) -> str:
     """Returns color based on FCR value."""
-    if fcr_value >= 80:
-        return COLORS['excellent']
-    elif fcr_value >= 70:
-        return COLORS['good']
-    elif fcr_value >= 50:
-        return COLORS['warning']
-    else:
-        return COLORS['critical']
+    return FCR_COLOR_LUT[np.searchsorted(FCR_COLOR_BINS, fcr_value, side='right')]
+
+
+def get_fcr_color_array(fcr_values) -> np.ndarray:
+    """
+    Vectorized get_fcr_color for many values (e.g. per-agent FCR rates).
+    
+    Args:
+        fcr_values: Array-like of FCR % values
+        
+    Returns:
+        Object array of color strings
+    """
+    return FCR_COLOR_LUT[np.searchsorted(FCR_COLOR_BINS, np.asarray(fcr_values), side='right')]
 
 
 def get_fcr_insights(fcr_agent: float, fcr_computed: float) -> Dict:
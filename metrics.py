@@ -5,7 +5,9 @@ CC Analytics - Metrics Computation Module
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
+
+from data_generation import TOPICS
 
 
 # ============================================================================
@@ -26,6 +28,14 @@ COMPLIANCE_WEIGHTS = {
 }
 
 
+# Polia s risk bodmi pri nesplnení (kritické = 5, ostatné podľa COMPLIANCE_WEIGHTS)
+COMPLIANCE_RISK_FIELDS = tuple(sorted(CRITICAL_COMPLIANCE_FIELDS)) + tuple(COMPLIANCE_WEIGHTS)
+COMPLIANCE_RISK_WEIGHTS = np.array([5] * len(CRITICAL_COMPLIANCE_FIELDS) + list(COMPLIANCE_WEIGHTS.values()))
+
+# (pole, risk body) páry pre skalárny compliance_score - bez vnorených cyklov
+COMPLIANCE_RISK_ITEMS = tuple(zip(COMPLIANCE_RISK_FIELDS, COMPLIANCE_RISK_WEIGHTS.tolist()))
+
+
 def compliance_score(comp: Dict) -> Dict:
     """
     Vypočíta compliance score a risk level.
@@ -36,27 +46,16 @@ def compliance_score(comp: Dict) -> Dict:
     Returns:
         Dict s: score (%), risk_points, risk_level
     """
-    # Získaj všetky boolean polia
-    bool_items = [k for k, v in comp.items() if isinstance(v, bool)]
+    # Získaj všetky boolean hodnoty (jeden prechod cez dict)
+    bool_values = [v for v in comp.values() if isinstance(v, bool)]
     
-    if not bool_items:
+    if not bool_values:
         return {"score": 0.0, "risk_points": 100, "risk_level": "High"}
     
-    passed = sum(1 for k in bool_items if comp[k])
-    score = round(100 * passed / len(bool_items), 1)
-    
-    # Risk points
-    risk_points = 0
+    score = 100 * sum(bool_values) / len(bool_values)
     
-    # Kritické polia = 5 bodov každé
-    for critical_field in CRITICAL_COMPLIANCE_FIELDS:
-        if not comp.get(critical_field, False):
-            risk_points += 5
-    
-    # Vážené polia
-    for field, weight in COMPLIANCE_WEIGHTS.items():
-        if not comp.get(field, False):
-            risk_points += weight
+    # Risk points: kritické polia = 5 bodov každé, ostatné podľa COMPLIANCE_WEIGHTS
+    risk_points = sum(weight for field, weight in COMPLIANCE_RISK_ITEMS if not comp.get(field, False))
     
     # Kritické violations = 7 bodov
     critical_violations = comp.get("critical_violations", [])
@@ -79,6 +78,58 @@ def compliance_score(comp: Dict) -> Dict:
     }
 
 
+# Risk level podľa risk_points: < 5 Low, < 15 Medium, inak High
+RISK_LEVEL_BINS = np.array([5, 15])
+RISK_LEVELS = np.array(["Low", "Medium", "High"], dtype=object)
+
+COMPLIANCE_RESULT_COLUMNS = ["score", "risk_points", "risk_level", "critical_violations_count"]
+
+# Prefix stĺpcov s rozbaleným compliance výsledkom (comp_score, comp_risk_level, ...)
+COMPLIANCE_RESULT_PREFIX = "comp_"
+
+
+def compliance_scores_frame(calls_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Vektorizovaná verzia compliance_score pre celý DataFrame.
+    
+    Compliance dicty sa rozbalia do bool matice (riadok = hovor), risk body
+    sú jeden maticový súčin s váhami. Ak dicty nemajú jednotné bool polia,
+    použije sa compliance_score po riadkoch.
+    
+    Returns:
+        DataFrame s: score, risk_points, risk_level, critical_violations_count
+    """
+    flags = pd.DataFrame(calls_df["compliance"].tolist(), index=calls_df.index)
+    violations = flags.pop("critical_violations") if "critical_violations" in flags.columns else None
+    
+    uniform = (
+        len(flags.columns) > 0
+        and violations is not None
+        and violations.notna().all()
+        and all(pd.api.types.is_bool_dtype(flags[col]) for col in flags.columns)
+    )
+    if not uniform:
+        return pd.DataFrame(
+            calls_df["compliance"].map(compliance_score).tolist(),
+            index=calls_df.index,
+            columns=COMPLIANCE_RESULT_COLUMNS,
+        )
+    
+    matrix = flags.to_numpy(dtype=bool)
+    passed_ratio = 100 * matrix.sum(axis=1) / matrix.shape[1]
+    
+    failed = ~flags.reindex(columns=list(COMPLIANCE_RISK_FIELDS), fill_value=False).to_numpy(dtype=bool)
+    violations_count = violations.map(len).to_numpy()
+    risk_points = failed @ COMPLIANCE_RISK_WEIGHTS + 7 * (violations_count > 0)
+    
+    return pd.DataFrame({
+        "score": passed_ratio,
+        "risk_points": risk_points,
+        "risk_level": RISK_LEVELS[np.searchsorted(RISK_LEVEL_BINS, risk_points, side="right")],
+        "critical_violations_count": violations_count,
+    }, index=calls_df.index)
+
+
 # ============================================================================
 # SENTIMENT METRICS
 # ============================================================================
@@ -122,9 +173,9 @@ def compute_sentiment_journey(s_start: float, s_mid: float, s_end: float) -> Dic
     ]
     
     return {
-        "delta": round(delta, 3),
+        "delta": delta,
         "trend": trend,
-        "recovery_rate": round(recovery_rate, 1),
+        "recovery_rate": recovery_rate,
         "journey": journey
     }
 
@@ -133,6 +184,63 @@ def compute_sentiment_journey(s_start: float, s_mid: float, s_end: float) -> Dic
 # RESOLUTION METRICS
 # ============================================================================
 
+# Prefix stĺpcov s rozbalenými resolution poliami (res_resolution_achieved, ...)
+RESOLUTION_FIELD_PREFIX = "res_"
+
+# Úrovne resolution_achieved (kódy 0/1/2) - res_resolution_achieved je kategória s týmto poradím
+RESOLUTION_LEVELS = ("none", "partial", "full")
+RESOLUTION_DTYPE = pd.CategoricalDtype(RESOLUTION_LEVELS, ordered=True)
+RESOLUTION_FULL_CODE = RESOLUTION_LEVELS.index("full")
+
+
+def resolution_fields_frame(calls_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Rozbalí stĺpec resolution dictov do DataFrame (jeden stĺpec na pole).
+    
+    Args:
+        calls_df: DataFrame s resolution dict
+        
+    Returns:
+        DataFrame s rovnakým indexom ako calls_df
+    """
+    res = pd.DataFrame(calls_df["resolution"].tolist(), index=calls_df.index)
+    if "resolution_achieved" in res.columns:
+        res["resolution_achieved"] = res["resolution_achieved"].astype(RESOLUTION_DTYPE)
+    return res
+
+
+def resolution_field(calls_df: pd.DataFrame, field: str) -> pd.Series:
+    """
+    Jedno resolution pole ako Series - z predpočítaného res_<pole> stĺpca, ak existuje.
+    
+    Args:
+        calls_df: DataFrame s resolution dict (prípadne s res_ stĺpcami)
+        field: Názov poľa v resolution dicte
+        
+    Returns:
+        Series hodnôt poľa
+    """
+    column = RESOLUTION_FIELD_PREFIX + field
+    if column in calls_df.columns:
+        return calls_df[column]
+    return calls_df["resolution"].map(lambda r: r.get(field))
+
+
+def resolution_codes(calls_df: pd.DataFrame) -> np.ndarray:
+    """
+    Kódy resolution_achieved podľa RESOLUTION_LEVELS (neznáme hodnoty = -1).
+    
+    Predpočítaný kategorický stĺpec sa použije priamo, inak sa hodnoty zakódujú raz.
+    
+    Returns:
+        int8 ndarray kódov
+    """
+    achieved = resolution_field(calls_df, "resolution_achieved")
+    if achieved.dtype == RESOLUTION_DTYPE:
+        return achieved.cat.codes.to_numpy()
+    return pd.Categorical(achieved, dtype=RESOLUTION_DTYPE).codes
+
+
 def is_fcr(res: Dict) -> bool:
     """
     First Contact Resolution check.
@@ -150,6 +258,20 @@ def is_fcr(res: Dict) -> bool:
     )
 
 
+def is_fcr_flags(calls_df: pd.DataFrame) -> pd.Series:
+    """
+    Vektorizovaná verzia is_fcr pre celý DataFrame.
+    
+    Returns:
+        Bool Series (full resolution, no callback, no escalation)
+    """
+    return (
+        (resolution_codes(calls_df) == RESOLUTION_FULL_CODE) &
+        ~resolution_field(calls_df, "callback_needed").astype(bool) &
+        ~resolution_field(calls_df, "escalated").astype(bool)
+    )
+
+
 def calculate_fcr_rate(calls_df: pd.DataFrame) -> Dict:
     """
     Vypočíta FCR rate pre dataset.
@@ -161,7 +283,7 @@ def calculate_fcr_rate(calls_df: pd.DataFrame) -> Dict:
     if total == 0:
         return {"fcr_rate": 0.0, "fcr_count": 0, "total_calls": 0}
     
-    fcr_count = sum(is_fcr(row["resolution"]) for _, row in calls_df.iterrows())
+    fcr_count = int(is_fcr_flags(calls_df).sum())
     fcr_rate = round(100 * fcr_count / total, 1)
     
     return {
@@ -182,17 +304,18 @@ def calculate_escalation_prevention_rate(calls_df: pd.DataFrame) -> Dict:
     if total == 0:
         return {"epr": 0.0, "prevented_count": 0, "escalated_count": 0, "reasons_breakdown": {}}
     
-    escalated_count = sum(row["resolution"].get("escalated", False) for _, row in calls_df.iterrows())
+    escalated_mask = resolution_field(calls_df, "escalated").astype(bool)
+    escalated_count = int(escalated_mask.sum())
     prevented_count = total - escalated_count
     
     epr = round(100 * prevented_count / total, 1)
     
-    # Reasons breakdown
-    reasons = {}
-    for _, row in calls_df.iterrows():
-        if row["resolution"].get("escalated", False):
-            reason = row["resolution"].get("escalation_reason", "unknown")
-            reasons[reason] = reasons.get(reason, 0) + 1
+    # Reasons breakdown (poradie prvého výskytu)
+    reasons = (
+        resolution_field(calls_df, "escalation_reason")[escalated_mask]
+        .value_counts(sort=False)
+        .to_dict()
+    )
     
     return {
         "epr": epr,
@@ -206,6 +329,18 @@ def calculate_escalation_prevention_rate(calls_df: pd.DataFrame) -> Dict:
 # QUALITY METRICS
 # ============================================================================
 
+# Binárne quality polia, z ktorých sa počíta quality score
+QUALITY_BINARY_FIELDS = (
+    "active_listening",
+    "empathy_shown",
+    "solution_offered",
+    "professional_tone",
+)
+
+# Prefix bool stĺpcov s quality flagmi (q_active_listening, ...)
+QUALITY_FLAG_PREFIX = "q_"
+
+
 def quality_binary_score(q: Dict) -> float:
     """
     Vypočíta quality score z boolean polí (%).
@@ -216,21 +351,52 @@ def quality_binary_score(q: Dict) -> float:
     Returns:
         Score 0-100
     """
-    binary_items = [
-        q.get("active_listening", False),
-        q.get("empathy_shown", False),
-        q.get("solution_offered", False),
-        q.get("professional_tone", False),
-    ]
+    binary_items = [q.get(field, False) for field in QUALITY_BINARY_FIELDS]
     
-    score = round(100 * sum(bool(x) for x in binary_items) / len(binary_items), 1)
-    return score
+    return 100 * sum(bool(x) for x in binary_items) / len(binary_items)
+
+
+def quality_flags_frame(calls_df: pd.DataFrame, fields: Tuple[str, ...] = QUALITY_BINARY_FIELDS) -> pd.DataFrame:
+    """
+    Rozbalí stĺpec quality dictov do bool DataFrame (jeden stĺpec na pole).
+    
+    Args:
+        calls_df: DataFrame s quality dict
+        fields: Quality polia, ktoré sa majú extrahovať
+        
+    Returns:
+        Bool DataFrame s rovnakým indexom ako calls_df
+    """
+    flags = pd.DataFrame(calls_df["quality"].tolist(), index=calls_df.index)
+    return flags.reindex(columns=list(fields)).fillna(False).astype(bool)
+
+
+def quality_binary_scores(calls_df: pd.DataFrame) -> pd.Series:
+    """
+    Vektorizovaná verzia quality_binary_score pre celý DataFrame.
+    
+    Returns:
+        Series so score 0-100 pre každý hovor
+    """
+    flag_cols = [QUALITY_FLAG_PREFIX + field for field in QUALITY_BINARY_FIELDS]
+    if set(flag_cols).issubset(calls_df.columns):
+        flags = calls_df[flag_cols]
+    else:
+        flags = quality_flags_frame(calls_df)
+    # Rovnaké poradie operácií ako quality_binary_score
+    return 100 * flags.sum(axis=1) / flags.shape[1]
 
 
 # ============================================================================
 # AGENT EFFECTIVENESS SCORE (AES)
 # ============================================================================
 
+# Body za resolution v AES (ostatné hodnoty = 0)
+RESOLUTION_POINTS = {"full": 100, "partial": 50}
+# Lookup podľa kódu z resolution_codes; posledný prvok pokrýva neznáme hodnoty (kód -1)
+RESOLUTION_POINTS_LUT = np.array([RESOLUTION_POINTS.get(level, 0) for level in RESOLUTION_LEVELS] + [0], dtype=float)
+
+
 def aes(
     sentiment_start: float,
     sentiment_end: float,
@@ -263,12 +429,7 @@ def aes(
     sentiment_component = max(0, min(100, sentiment_component))
     
     # Resolution component
-    if res_achieved == "full":
-        resolution_component = 100
-    elif res_achieved == "partial":
-        resolution_component = 50
-    else:
-        resolution_component = 0
+    resolution_component = RESOLUTION_POINTS.get(res_achieved, 0)
     
     # Weighted sum
     score = (
@@ -278,7 +439,7 @@ def aes(
         0.15 * quality_score
     )
     
-    return round(score, 1)
+    return score
 
 
 def calculate_aes_for_call(row: pd.Series) -> float:
@@ -295,22 +456,79 @@ def calculate_aes_for_call(row: pd.Series) -> float:
     )
 
 
+def resolution_points(calls_df: pd.DataFrame) -> np.ndarray:
+    """
+    AES body za resolution pre všetky hovory naraz.
+    
+    Body sa vyberú z lookup tabuľky podľa kódov resolution_achieved.
+    
+    Returns:
+        ndarray bodov (100 / 50 / 0) pre každý hovor
+    """
+    return RESOLUTION_POINTS_LUT[resolution_codes(calls_df)]
+
+
+def calculate_aes_scores(calls_df: pd.DataFrame) -> pd.Series:
+    """
+    Vektorizovaná verzia calculate_aes_for_call pre celý DataFrame.
+    
+    Použije predpočítané comp_score / quality_score stĺpce, ak existujú.
+    
+    Returns:
+        Series s AES 0-100 pre každý hovor
+    """
+    if "comp_score" in calls_df.columns:
+        comp_scores = calls_df["comp_score"].to_numpy(dtype=float)
+    else:
+        comp_scores = compliance_scores_frame(calls_df)["score"].to_numpy(dtype=float)
+    if "quality_score" in calls_df.columns:
+        quality_scores = calls_df["quality_score"].to_numpy(dtype=float)
+    else:
+        quality_scores = quality_binary_scores(calls_df).to_numpy(dtype=float)
+    
+    sentiment_delta = calls_df["sentiment_end"].to_numpy(dtype=float) - calls_df["sentiment_start"].to_numpy(dtype=float)
+    resolution_component = resolution_points(calls_df)
+    
+    # Vážený súčet in-place do jedného výsledného a jedného pomocného poľa
+    # (rovnaké poradie sčítania ako aes() → bitovo zhodný výsledok)
+    score = sentiment_delta
+    score += 2
+    score /= 4
+    score *= 100
+    np.clip(score, 0, 100, out=score)
+    score *= 0.25
+    term = np.multiply(comp_scores, 0.30)
+    score += term
+    np.multiply(resolution_component, 0.30, out=term)
+    score += term
+    np.multiply(quality_scores, 0.15, out=term)
+    score += term
+    return pd.Series(score, index=calls_df.index, dtype=float)
+
+
 # ============================================================================
 # AGENT CONSISTENCY INDEX (ACI)
 # ============================================================================
 
-def aci(aes_series: List[float]) -> Dict:
+# Hranice ACI stability (score >= hranica → vyššia úroveň)
+ACI_STABILITY_BINS = np.array([50, 70, 85])
+ACI_STABILITY_LABELS = np.array(["Highly Unstable", "Unstable", "Stable", "Very Stable"], dtype=object)
+
+
+def aci(aes_series: Union[List[float], np.ndarray]) -> Dict:
     """
     Agent Consistency Index - invertovaný coefficient of variation.
     
     Args:
-        aes_series: List AES hodnôt pre agenta
+        aes_series: List alebo ndarray AES hodnôt pre agenta (ndarray sa nekopíruje)
         
     Returns:
         Dict s: aci (0-100), stability (label), std, mean
     """
-    if len(aes_series) < 2:
-        val = aes_series[0] if aes_series else 0.0
+    arr = aes_series if isinstance(aes_series, np.ndarray) else np.asarray(aes_series, dtype=np.float64)
+    
+    if len(arr) < 2:
+        val = float(arr[0]) if len(arr) else 0.0
         return {
             "aci": 100.0,
             "stability": "N/A",
@@ -318,8 +536,8 @@ def aci(aes_series: List[float]) -> Dict:
             "mean": round(val, 1)
         }
     
-    mean = float(np.mean(aes_series))
-    std = float(np.std(aes_series))
+    mean = float(arr.mean())
+    std = float(arr.std())
     
     # Coefficient of variation
     cv = (std / mean) if mean > 0 else 0
@@ -356,18 +574,29 @@ def calculate_tre(calls_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame s: topic, avg_time, benchmark, efficiency %, resolution_rate %, status
     """
-    from data_generation import TOPICS
-    
-    # Benchmarky z TOPICS
-    topic_stats = []
     
-    for topic in TOPICS.keys():
-        topic_calls = calls_df[calls_df["resolution"].apply(lambda x: x["issue_category"] == topic)]
-        
-        if len(topic_calls) == 0:
-            continue
-        
-        avg_time = topic_calls["duration_sec"].mean()
+    # Jeden groupby pre všetky topicy
+    resolved_full = pd.Series(resolution_codes(calls_df) == RESOLUTION_FULL_CODE, index=calls_df.index)
+    grouped = resolved_full.groupby(calls_df["issue_category"], observed=True)
+    per_topic = pd.DataFrame({
+        "avg_time": calls_df["duration_sec"].groupby(calls_df["issue_category"], observed=True).mean(),
+        "resolved": grouped.sum(),
+        "call_count": grouped.size(),
+    })
+    
+    # Benchmarky z TOPICS (poradie podľa TOPICS) - predalokované stĺpce
+    topics = [topic for topic in TOPICS.keys() if topic in per_topic.index]
+    n_topics = len(topics)
+    avg_times = np.empty(n_topics)
+    benchmarks = np.empty(n_topics, dtype=np.int64)
+    efficiencies = np.empty(n_topics)
+    resolution_rates = np.empty(n_topics)
+    call_counts = np.empty(n_topics, dtype=np.int64)
+    statuses = [""] * n_topics
+    
+    for i, topic in enumerate(topics):
+        avg_time = per_topic.at[topic, "avg_time"]
+        call_count = int(per_topic.at[topic, "call_count"])
         benchmark = TOPICS[topic]["avg_duration"]
         
         # Efficiency: nižší čas = lepšie (ak je pod benchmarkom)
@@ -377,8 +606,7 @@ def calculate_tre(calls_df: pd.DataFrame) -> pd.DataFrame:
             efficiency = max(0, 100 * (1 - (avg_time - benchmark) / benchmark))
         
         # Resolution rate
-        resolved = sum(topic_calls["resolution"].apply(lambda x: x["resolution_achieved"] == "full"))
-        resolution_rate = round(100 * resolved / len(topic_calls), 1)
+        resolution_rate = round(100 * int(per_topic.at[topic, "resolved"]) / call_count, 1)
         
         # Status
         if efficiency >= 90 and resolution_rate >= 80:
@@ -390,17 +618,25 @@ def calculate_tre(calls_df: pd.DataFrame) -> pd.DataFrame:
         else:
             status = "Critical"
         
-        topic_stats.append({
-            "topic": topic.capitalize(),
-            "avg_time": round(avg_time, 1),
-            "benchmark": benchmark,
-            "efficiency": round(efficiency, 1),
-            "resolution_rate": resolution_rate,
-            "status": status,
-            "call_count": len(topic_calls)
-        })
-    
-    return pd.DataFrame(topic_stats)
+        avg_times[i] = round(avg_time, 1)
+        benchmarks[i] = benchmark
+        efficiencies[i] = round(efficiency, 1)
+        resolution_rates[i] = resolution_rate
+        statuses[i] = status
+        call_counts[i] = call_count
+    
+    if n_topics == 0:
+        return pd.DataFrame()
+    
+    return pd.DataFrame({
+        "topic": [topic.capitalize() for topic in topics],
+        "avg_time": avg_times,
+        "benchmark": benchmarks,
+        "efficiency": efficiencies,
+        "resolution_rate": resolution_rates,
+        "status": statuses,
+        "call_count": call_counts,
+    })
 
 
 # ============================================================================
@@ -421,17 +657,19 @@ def calculate_7day_trend(calls_df: pd.DataFrame, metric_col: str = "aes") -> pd.
     if metric_col not in calls_df.columns:
         # Musíme vypočítať
         if metric_col == "aes":
-            calls_df["aes"] = calls_df.apply(calculate_aes_for_call, axis=1)
-    
-    # Groupby date
-    calls_df["date"] = pd.to_datetime(calls_df["timestamp"]).dt.date
-    
-    daily = calls_df.groupby("date")[metric_col].mean().reset_index()
-    daily.columns = ["date", "metric_avg"]
-    daily["metric_avg"] = daily["metric_avg"].round(1)
-    
-    # Posledných 7 dní
-    daily = daily.sort_values("date").tail(7)
+            calls_df["aes"] = calculate_aes_scores(calls_df)
+    
+    # timestamp je datetime64 už z generátora; parsovanie len ako fallback
+    timestamps = calls_df["timestamp"]
+    if not np.issubdtype(timestamps.dtype, np.datetime64):
+        timestamps = pd.to_datetime(timestamps)
+    
+    # Denné priemery cez resample na datetime64 (bez Python date objektov), posledných 7 dní
+    daily = (
+        calls_df[metric_col].set_axis(timestamps).resample("D").mean()
+        .dropna().tail(7).round(1)
+        .rename_axis("date").reset_index(name="metric_avg")
+    )
     
     return daily
 
@@ -447,13 +685,13 @@ def calculate_volume_distribution(calls_df: pd.DataFrame, group_by: str = "topic
         Dict s counts
     """
     if group_by == "topic":
-        counts = calls_df["resolution"].apply(lambda x: x["issue_category"]).value_counts().to_dict()
-    elif group_by in calls_df.columns:
-        counts = calls_df[group_by].value_counts().to_dict()
-    else:
-        counts = {}
+        group_by = "issue_category"
+    if group_by not in calls_df.columns:
+        return {}
     
-    return counts
+    # Categorical value_counts vracia aj nepozorované kategórie s nulou
+    counts = calls_df[group_by].value_counts()
+    return counts[counts > 0].to_dict()
 
 
 # ============================================================================
@@ -490,39 +728,52 @@ def calculate_agent_aggregates(calls_df: pd.DataFrame, agents_df: pd.DataFrame)
     Returns:
         DataFrame s: agent_id, agent_name, aes_avg, aci, fcr_rate, comp_avg, aht_avg, call_count
     """
-    # Vypočítať AES pre všetky hovory
-    calls_df["aes"] = calls_df.apply(calculate_aes_for_call, axis=1)
-    calls_df["comp_score"] = calls_df["compliance"].apply(lambda x: compliance_score(x)["score"])
-    calls_df["is_fcr"] = calls_df["resolution"].apply(is_fcr)
+    # Vypočítať AES pre všetky hovory (ak nie sú predpočítané pri načítaní)
+    if "aes" not in calls_df.columns:
+        calls_df["aes"] = calculate_aes_scores(calls_df)
+    if "comp_score" not in calls_df.columns:
+        calls_df["comp_score"] = compliance_scores_frame(calls_df)["score"]
+    if "is_fcr" not in calls_df.columns:
+        calls_df["is_fcr"] = is_fcr_flags(calls_df)
     
-    agent_stats = []
+    if len(calls_df) == 0:
+        return pd.DataFrame()
+    
+    # Jeden groupby pre všetkých agentov (poradie prvého výskytu ako unique())
+    grouped = calls_df.groupby("agent_id", sort=False, observed=True)
+    per_agent = grouped.agg(
+        agent_name=("agent_name", "first"),
+        team=("team", "first"),
+        aes_avg=("aes", "mean"),
+        fcr_sum=("is_fcr", "sum"),
+        comp_avg=("comp_score", "mean"),
+        aht_avg=("duration_sec", "mean"),
+        call_count=("aes", "size"),
+    )
     
-    for agent_id in calls_df["agent_id"].unique():
-        agent_calls = calls_df[calls_df["agent_id"] == agent_id]
-        
-        if len(agent_calls) == 0:
-            continue
-        
-        aes_values = agent_calls["aes"].tolist()
-        aci_result = aci(aes_values)
-        
-        agent_name = agent_calls.iloc[0]["agent_name"]
-        team = agent_calls.iloc[0]["team"]
-        
-        agent_stats.append({
-            "agent_id": agent_id,
-            "agent_name": agent_name,
-            "team": team,
-            "aes_avg": round(agent_calls["aes"].mean(), 1),
-            "aci": aci_result["aci"],
-            "stability": aci_result["stability"],
-            "fcr_rate": round(100 * agent_calls["is_fcr"].sum() / len(agent_calls), 1),
-            "comp_avg": round(agent_calls["comp_score"].mean(), 1),
-            "aht_avg": round(agent_calls["duration_sec"].mean(), 1),
-            "call_count": len(agent_calls)
-        })
-    
-    return pd.DataFrame(agent_stats)
+    # ACI vektorovo (ako aci(): menej ako 2 hovory → 100 / N/A)
+    aes_avg = per_agent["aes_avg"].to_numpy()
+    aes_std = grouped["aes"].std(ddof=0).to_numpy()
+    call_counts = per_agent["call_count"].to_numpy()
+    cv = np.divide(aes_std, aes_avg, out=np.zeros_like(aes_avg), where=aes_avg > 0)
+    aci_scores = np.maximum(0.0, 100.0 - 100.0 * cv)
+    single = call_counts < 2
+    aci_scores[single] = 100.0
+    stabilities = ACI_STABILITY_LABELS[np.searchsorted(ACI_STABILITY_BINS, aci_scores, side="right")]
+    stabilities[single] = "N/A"
+    
+    return pd.DataFrame({
+        "agent_id": per_agent.index.tolist(),
+        "agent_name": per_agent["agent_name"].tolist(),
+        "team": per_agent["team"].tolist(),
+        "aes_avg": per_agent["aes_avg"].round(1).to_numpy(),
+        "aci": np.round(aci_scores, 1),
+        "stability": stabilities.tolist(),
+        "fcr_rate": np.round(100 * per_agent["fcr_sum"].to_numpy() / call_counts, 1),
+        "comp_avg": per_agent["comp_avg"].round(1).to_numpy(),
+        "aht_avg": per_agent["aht_avg"].round(1).to_numpy(),
+        "call_count": call_counts.astype(np.int64),
+    })
 
 
 # ============================================================================
@@ -569,6 +820,20 @@ def bucket_sentiment(value: float) -> str:
         return "Pos"
 
 
+# Labely sentiment bucketov indexované kódom (0 = Neg, 1 = Neutral, 2 = Pos)
+SENTIMENT_BUCKET_LABELS = np.array(["Neg", "Neutral", "Pos"], dtype=object)
+
+
+def sentiment_bucket_codes(values: np.ndarray) -> np.ndarray:
+    """
+    Vektorizovaná verzia bucket_sentiment.
+    
+    Returns:
+        Int pole kódov: 0 = Neg (< -0.2), 1 = Neutral (<= 0.2), 2 = Pos
+    """
+    return (values >= -0.2).astype(np.int64) + (values > 0.2)
+
+
 def compute_sentiment_buckets(calls_df: pd.DataFrame) -> pd.DataFrame:
     """
     Vypočíta sentiment transition matrix (Start → End buckets).
@@ -582,13 +847,18 @@ def compute_sentiment_buckets(calls_df: pd.DataFrame) -> pd.DataFrame:
     if len(calls_df) == 0:
         return pd.DataFrame(columns=["start_bucket", "end_bucket", "count", "pct"])
     
-    # Bucket sentiments
-    calls_df = calls_df.copy()
-    calls_df["start_bucket"] = calls_df["sentiment_start"].apply(bucket_sentiment)
-    calls_df["end_bucket"] = calls_df["sentiment_end"].apply(bucket_sentiment)
+    # Bucket sentiments (kódy do SENTIMENT_BUCKET_LABELS, rovnaké hranice ako bucket_sentiment)
+    start_codes = sentiment_bucket_codes(calls_df["sentiment_start"].to_numpy())
+    end_codes = sentiment_bucket_codes(calls_df["sentiment_end"].to_numpy())
     
-    # Count transitions
-    transitions = calls_df.groupby(["start_bucket", "end_bucket"]).size().reset_index(name="count")
+    # Count transitions: iba pozorované kombinácie, v poradí (start, end)
+    counts = np.bincount(start_codes * 3 + end_codes, minlength=9)
+    observed = np.flatnonzero(counts)
+    transitions = pd.DataFrame({
+        "start_bucket": SENTIMENT_BUCKET_LABELS[observed // 3],
+        "end_bucket": SENTIMENT_BUCKET_LABELS[observed % 3],
+        "count": counts[observed],
+    })
     
     # Calculate percentages
     total = len(calls_df)
@@ -633,12 +903,21 @@ def compute_sentiment_improvement_kpis(calls_df: pd.DataFrame) -> Dict:
 # QUALITY BREAKDOWN - NEW FOR UI V2
 # ============================================================================
 
+# Výstupné stĺpce denných QA komponentov (% hovorov so splneným polom)
+QUALITY_COMPONENT_PCT_COLUMNS = {
+    "active_listening": "active_listening_pct",
+    "empathy_shown": "empathy_pct",
+    "solution_offered": "solution_pct",
+    "professional_tone": "professional_pct",
+}
+
+
 def compute_quality_components_daily(calls_df: pd.DataFrame) -> pd.DataFrame:
     """
     Vypočíta denné priemery 4 QA binárnych komponentov + AES.
     
     Args:
-        calls_df: DataFrame s quality dict a AES
+        calls_df: DataFrame s timestamp, quality (ideálne rozbalené q_ stĺpce) a AES
         
     Returns:
         DataFrame s: date, active_listening_pct, empathy_pct, solution_pct, professional_pct, aes_avg
@@ -646,37 +925,30 @@ def compute_quality_components_daily(calls_df: pd.DataFrame) -> pd.DataFrame:
     if len(calls_df) == 0:
         return pd.DataFrame(columns=["date", "active_listening_pct", "empathy_pct", "solution_pct", "professional_pct", "aes_avg"])
     
+    # Quality komponenty = bool q_ stĺpce (rozbalené raz, bez konverzie po poliach)
+    flag_cols = [QUALITY_FLAG_PREFIX + field for field in QUALITY_BINARY_FIELDS]
+    if set(flag_cols).issubset(calls_df.columns):
+        flags = calls_df[flag_cols]
+    else:
+        flags = quality_flags_frame(calls_df).add_prefix(QUALITY_FLAG_PREFIX)
+    components = flags.set_axis(list(QUALITY_BINARY_FIELDS), axis=1)
+    
     # Ensure AES is calculated
-    if "aes" not in calls_df.columns:
-        calls_df = calls_df.copy()
-        calls_df["aes"] = calls_df.apply(calculate_aes_for_call, axis=1)
-    
-    # Extract quality components
-    calls_df = calls_df.copy()
-    calls_df["date"] = pd.to_datetime(calls_df["timestamp"]).dt.date
-    calls_df["active_listening"] = calls_df["quality"].apply(lambda x: 1 if x.get("active_listening", False) else 0)
-    calls_df["empathy_shown"] = calls_df["quality"].apply(lambda x: 1 if x.get("empathy_shown", False) else 0)
-    calls_df["solution_offered"] = calls_df["quality"].apply(lambda x: 1 if x.get("solution_offered", False) else 0)
-    calls_df["professional_tone"] = calls_df["quality"].apply(lambda x: 1 if x.get("professional_tone", False) else 0)
-    
-    # Group by date
-    daily = calls_df.groupby("date").agg({
-        "active_listening": "mean",
-        "empathy_shown": "mean",
-        "solution_offered": "mean",
-        "professional_tone": "mean",
-        "aes": "mean"
-    }).reset_index()
-    
-    # Convert to percentages
-    daily["active_listening_pct"] = round(daily["active_listening"] * 100, 1)
-    daily["empathy_pct"] = round(daily["empathy_shown"] * 100, 1)
-    daily["solution_pct"] = round(daily["solution_offered"] * 100, 1)
-    daily["professional_pct"] = round(daily["professional_tone"] * 100, 1)
-    daily["aes_avg"] = round(daily["aes"], 1)
-    
-    # Keep only needed columns
-    daily = daily[["date", "active_listening_pct", "empathy_pct", "solution_pct", "professional_pct", "aes_avg"]]
+    components["aes"] = calls_df["aes"] if "aes" in calls_df.columns else calculate_aes_scores(calls_df)
+    # Deň ako int64 (dni od epochy) - groupby na neboxovaných int kľúčoch, dátum až pre výsledné dni
+    timestamps = pd.to_datetime(calls_df["timestamp"]).to_numpy()
+    components["day"] = timestamps.astype("datetime64[D]").view("int64")
+    
+    # Group by date - výstupné názvy priamo v named agg, percentá a zaokrúhlenie raz nad blokom
+    pct_columns = list(QUALITY_COMPONENT_PCT_COLUMNS.values())
+    daily = components.groupby("day", sort=False).agg(
+        **{pct: (field, "mean") for field, pct in QUALITY_COMPONENT_PCT_COLUMNS.items()},
+        aes_avg=("aes", "mean"),
+    )
+    daily[pct_columns] *= 100
+    daily = daily.round(1)
+    daily.index = pd.to_datetime(daily.index.to_numpy().view("datetime64[D]"))
+    daily = daily.rename_axis("date").reset_index()
     
     # Last 7 days
     daily = daily.sort_values("date").tail(7)
@@ -698,16 +970,103 @@ def get_compliance_top_failures(calls_df: pd.DataFrame, top_n: int = 2) -> List[
     if len(calls_df) == 0:
         return []
     
-    # Count failures for each boolean field
-    failure_counts = {}
+    # Compliance dicty rozbalené do stĺpcov; zlyhanie = bool hodnota False
+    flags = pd.DataFrame(calls_df["compliance"].tolist())
+    failed = np.column_stack([
+        ~flags[col].to_numpy(dtype=bool) if pd.api.types.is_bool_dtype(flags[col])
+        else flags[col].map(lambda v: v is False).to_numpy(dtype=bool)
+        for col in flags.columns
+    ])
+    
+    fail_counts = failed.sum(axis=0)
+    has_failures = np.flatnonzero(fail_counts)
     
-    for _, row in calls_df.iterrows():
-        comp = row["compliance"]
-        for key, value in comp.items():
-            if isinstance(value, bool) and not value:
-                failure_counts[key] = failure_counts.get(key, 0) + 1
+    # Zhody v počte v poradí prvého zlyhania (ako pri prechode riadok po riadku)
+    first_fail = failed[:, has_failures].argmax(axis=0)
+    order = has_failures[np.lexsort((has_failures, first_fail, -fail_counts[has_failures]))]
     
-    # Sort by count descending
-    sorted_failures = sorted(failure_counts.items(), key=lambda x: x[1], reverse=True)
+    return [(flags.columns[i], int(fail_counts[i])) for i in order[:top_n]]
+
+
+# ============================================================================
+# OVERVIEW METRICS
+# ============================================================================
+
+# Vážené AES komponenty per hovor (predpočítané stĺpce)
+AES_COMPONENT_COLUMNS = {
+    "Sentiment": "aes_sentiment",
+    "Compliance": "aes_compliance",
+    "Resolution": "aes_resolution",
+    "Quality": "aes_quality",
+}
+
+# Váhy AES komponentov v poradí AES_COMPONENT_COLUMNS
+AES_COMPONENT_WEIGHTS = np.array([0.25, 0.30, 0.30, 0.15])
+
+
+def compute_overview_metrics(calls_df: pd.DataFrame) -> Dict:
+    """
+    Všetky skalárne KPI pre Overview tab v jednom prechode.
     
-    return sorted_failures[:top_n]
+    AES komponenty sú priemery predpočítaných aes_* stĺpcov, compliance
+    metriky sa čítajú z rozbalených comp_ stĺpcov.
+    
+    Args:
+        calls_df: DataFrame z precompute_call_columns
+        
+    Returns:
+        Dict s: components, avg_aes, avg_comp_score, critical_violations, fcr_computed
+    """
+    return {
+        "components": {name: calls_df[col].mean() for name, col in AES_COMPONENT_COLUMNS.items()},
+        "avg_aes": calls_df["aes"].mean(),
+        "avg_comp_score": calls_df["comp_score"].mean(),
+        "critical_violations": int(calls_df["comp_critical_violations_count"].sum()),
+        "fcr_computed": (resolution_field(calls_df, "callback_needed") == "no").mean() * 100,
+    }
+
+
+# ============================================================================
+# PRECOMPUTED CALL COLUMNS
+# ============================================================================
+
+def precompute_call_columns(calls_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Odvodené per-call stĺpce, počítané raz pri načítaní datasetu.
+    
+    Quality dicty sa rozbalia do bool stĺpcov q_<pole>, resolution dicty
+    do stĺpcov res_<pole> a compliance výsledok do comp_<pole>, takže
+    agregácie nad nimi sú čisté NumPy redukcie. Pôvodné dict stĺpce ostávajú
+    (detail hovoru z nich číta položky a moments).
+    
+    Args:
+        calls_df: DataFrame z generate_dataset
+        
+    Returns:
+        Nový DataFrame s q_<pole>, res_<pole>, comp_<pole>, quality_score, comp_result, is_fcr,
+        aes a vážené AES komponenty aes_*
+    """
+    calls_df = calls_df.join(quality_flags_frame(calls_df).add_prefix(QUALITY_FLAG_PREFIX))
+    calls_df = calls_df.join(resolution_fields_frame(calls_df).add_prefix(RESOLUTION_FIELD_PREFIX))
+    calls_df["quality_score"] = quality_binary_scores(calls_df)
+    comp = compliance_scores_frame(calls_df)
+    calls_df["comp_result"] = pd.Series(comp.to_dict("records"), index=calls_df.index, dtype=object)
+    calls_df = calls_df.join(comp.add_prefix(COMPLIANCE_RESULT_PREFIX))
+    calls_df["is_fcr"] = is_fcr_flags(calls_df)
+    calls_df["aes"] = calculate_aes_scores(calls_df)
+    
+    # Vážené AES komponenty: surové signály v jednom 2D bloku, váhy jedným broadcastom
+    # Sentiment body (delta + 2) / 4 * 100 in-place nad numpy poľom (žiadne dočasné Series)
+    sentiment_points = calls_df["sentiment_end"].to_numpy(dtype=float) - calls_df["sentiment_start"].to_numpy(dtype=float)
+    sentiment_points += 2
+    sentiment_points /= 4
+    sentiment_points *= 100
+    raw_components = np.column_stack([
+        sentiment_points,
+        calls_df["comp_score"].to_numpy(dtype=float),
+        resolution_points(calls_df),
+        calls_df["quality_score"].to_numpy(dtype=float),
+    ])
+    raw_components *= AES_COMPONENT_WEIGHTS
+    components = pd.DataFrame(raw_components, index=calls_df.index, columns=list(AES_COMPONENT_COLUMNS.values()))
+    return calls_df.join(components)
@@ -7,7 +7,7 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List
 
 
@@ -20,6 +20,54 @@ COLORS = {
     'target': '#9E9E9E',
 }
 
+# Stacked bar order: (legend name, daily column, color)
+QA_COMPONENTS = (
+    ("Quality", "quality_pct", COLORS['quality']),
+    ("Resolution", "resolution_pct", COLORS['resolution']),
+    ("Compliance", "compliance_pct", COLORS['compliance']),
+    ("Sentiment", "sentiment_pct", COLORS['sentiment']),
+)
+
+# Daily QA component -> precomputed q_ quality flag column
+QA_FLAG_COLUMNS = {
+    'active_listening': 'q_active_listening',
+    'empathy': 'q_empathy_shown',
+    'solution_offered': 'q_solution_offered',
+    'professional_tone': 'q_professional_tone',
+}
+
+# Daily AES component -> precomputed weighted aes_* column
+AES_COMPONENT_COLUMNS = {
+    'sentiment_component': 'aes_sentiment',
+    'compliance_component': 'aes_compliance',
+    'resolution_component': 'aes_resolution',
+    'quality_component': 'aes_quality',
+}
+
+# Static figure layouts, built once at import (per-render code only supplies the traces)
+TREND_LAYOUT = dict(
+    title="7-Day Quality Breakdown Trend",
+    xaxis=dict(title="Date", showgrid=False),
+    yaxis=dict(title="Component Score (%)", range=[0, 100], showgrid=True, gridcolor='#f1f5f9'),
+    height=350,
+    margin=dict(l=60, r=40, t=60, b=60),
+    plot_bgcolor='white',
+    paper_bgcolor='white',
+    barmode='stack',
+    showlegend=True,
+    legend=dict(
+        orientation="h",
+        yanchor="bottom",
+        y=-0.25,
+        xanchor="center",
+        x=0.5
+    ),
+    font=dict(family='Inter', size=12),
+    hovermode='x unified'
+)
+
+EMPTY_TREND_LAYOUT = dict(height=350, margin=dict(l=40, r=20, t=40, b=40))
+
 
 def create_quality_trend_redesigned(df: pd.DataFrame, target: float = 75.0) -> go.Figure:
     """
@@ -45,92 +93,91 @@ def create_quality_trend_redesigned(df: pd.DataFrame, target: float = 75.0) -> g
             showarrow=False,
             font=dict(size=14, color='#64748b')
         )
-        fig.update_layout(height=350, margin=dict(l=40, r=20, t=40, b=40))
+        fig.update_layout(EMPTY_TREND_LAYOUT)
         return fig
     
-    fig = go.Figure()
-    
-    # QA Components as stacked bars
-    qa_components = [
-        ("Quality", "quality_pct", COLORS['quality']),
-        ("Resolution", "resolution_pct", COLORS['resolution']),
-        ("Compliance", "compliance_pct", COLORS['compliance']),
-        ("Sentiment", "sentiment_pct", COLORS['sentiment'])
-    ]
-    
-    for name, col, color in qa_components:
-        fig.add_trace(go.Bar(
+    # QA Components as stacked bars (all traces passed to the Figure at once)
+    traces = [
+        go.Bar(
             x=daily_data['date_str'],
             y=daily_data[col],
             name=name,
             marker=dict(color=color),
             hovertemplate=f'{name}: %{{y:.1f}}%<extra></extra>',
             width=0.7
-        ))
-    
-    # Update layout
-    fig.update_layout(
-        title="7-Day Quality Breakdown Trend",
-        xaxis_title="Date",
-        yaxis=dict(title="Component Score (%)", range=[0, 100]),
-        height=350,
-        margin=dict(l=60, r=40, t=60, b=60),
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        barmode='stack',
-        showlegend=True,
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=-0.25,
-            xanchor="center",
-            x=0.5
-        ),
-        font=dict(family='Inter', size=12),
-        hovermode='x unified'
-    )
-    
-    fig.update_xaxes(showgrid=False)
-    fig.update_yaxes(showgrid=True, gridcolor='#f1f5f9')
+        )
+        for name, col, color in QA_COMPONENTS
+    ]
+    
+    fig = go.Figure(data=traces, layout=TREND_LAYOUT)
     
     return fig
 
 
+def _daily_call_features(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Builds the per-call feature frame shared by the daily prep functions.
+    
+    Only the date, AES and component columns are taken from the calls frame,
+    so the (dict-heavy) input is never copied as a whole.
+    
+    Args:
+        df: Calls dataframe with precomputed q_ flag and aes_* columns
+        
+    Returns:
+        DataFrame with day (int64 days since epoch), float32 aes / AES component columns
+        and bool QA flag columns
+    """
+    columns = {'aes': 'aes', **QA_FLAG_COLUMNS, **AES_COMPONENT_COLUMNS}
+    features = df[list(columns.values())].set_axis(list(columns), axis=1)
+    
+    # Scores are only plotted (1 decimal), so float32 halves what the daily means stream;
+    # QA flags stay bool (1 byte each)
+    features = features.astype({col: np.float32 for col in ['aes', *AES_COMPONENT_COLUMNS]})
+    
+    # Day as int64 days since epoch - the groupby hashes plain integers
+    if 'date' in df.columns:
+        features['day'] = pd.to_datetime(df['date']).to_numpy().astype('datetime64[D]').view('int64')
+    else:
+        # Generate mock dates for last 7 days (numpy day offsets, no object-array sampling)
+        first_day = np.datetime64(datetime.now().date()) - np.timedelta64(6, 'D')
+        day_offsets = np.random.randint(0, 7, size=len(df)).astype('timedelta64[D]')
+        features['day'] = (first_day + day_offsets).view('int64')
+    
+    return features
+
+
+def _group_by_day(features: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Daily means of the given feature columns, keyed back to a date column.
+    
+    Args:
+        features: Frame from _daily_call_features
+        columns: Columns to average per day
+        
+    Returns:
+        DataFrame with date plus the averaged columns (one row per day)
+    """
+    daily = features.groupby('day', sort=False)[columns].mean()
+    daily.index = pd.to_datetime(daily.index.to_numpy().view('datetime64[D]'))
+    return daily.rename_axis('date').reset_index()
+
+
 def prepare_qa_components_daily(df: pd.DataFrame) -> pd.DataFrame:
     """
     Prepares daily QA component percentages (how many calls passed each component).
     
     Args:
-        df: Raw calls dataframe with quality field
+        df: Calls dataframe with q_ quality flag columns
         
     Returns:
         DataFrame with daily percentages for each QA component
     """
     
-    # Ensure we have date column
-    if 'date' not in df.columns:
-        # Generate mock dates for last 7 days
-        today = datetime.now()
-        dates = [(today - timedelta(days=6-i)).date() for i in range(7)]
-        df = df.copy()
-        df['date'] = np.random.choice(dates, size=len(df))
-    
-    df = df.copy()
-    df['date'] = pd.to_datetime(df['date']).dt.date
-    
-    # Extract QA binary flags from quality field
-    df['active_listening'] = df['quality'].apply(lambda x: 1 if x.get('active_listening', False) else 0)
-    df['empathy'] = df['quality'].apply(lambda x: 1 if x.get('empathy', False) else 0)
-    df['solution_offered'] = df['quality'].apply(lambda x: 1 if x.get('solution_offered', False) else 0)
-    df['professional_tone'] = df['quality'].apply(lambda x: 1 if x.get('professional_tone', False) else 0)
-    
-    # Group by date and calculate percentages
-    daily = df.groupby('date').agg({
-        'active_listening': 'mean',
-        'empathy': 'mean',
-        'solution_offered': 'mean',
-        'professional_tone': 'mean'
-    }).reset_index()
+    features = _daily_call_features(df)
+    
+    # QA binary flags (bool q_ columns, averaged directly per day)
+    daily = _group_by_day(features, list(QA_FLAG_COLUMNS))
     
     # Convert to percentages
     daily['sentiment_pct'] = daily['active_listening'] * 100
@@ -152,39 +199,16 @@ def prepare_7day_data(df: pd.DataFrame) -> pd.DataFrame:
     Prepares 7-day aggregated data with AES and component breakdown.
     
     Args:
-        df: Raw calls dataframe
+        df: Calls dataframe with precomputed aes_* component columns
         
     Returns:
         DataFrame with daily aggregates
     """
     
-    # Ensure we have date column
-    if 'date' not in df.columns:
-        # Generate mock dates for last 7 days
-        today = datetime.now()
-        dates = [(today - timedelta(days=6-i)).date() for i in range(7)]
-        df = df.copy()
-        df['date'] = np.random.choice(dates, size=len(df))
-    
-    df = df.copy()
-    df['date'] = pd.to_datetime(df['date']).dt.date
-    
-    # Calculate component scores per call
-    df['sentiment_component'] = ((df["sentiment_end"] - df["sentiment_start"] + 2) / 4 * 100) * 0.25
-    df['compliance_component'] = df["comp_result"].apply(lambda x: x["score"]) * 0.30
-    df['resolution_component'] = df["resolution"].apply(
-        lambda x: 100 if x["resolution_achieved"] == "full" else (50 if x["resolution_achieved"] == "partial" else 0)
-    ) * 0.30
-    df['quality_component'] = df["quality_score"] * 0.15
-    
-    # Group by date
-    daily = df.groupby('date').agg({
-        'aes': 'mean',
-        'sentiment_component': 'mean',
-        'compliance_component': 'mean',
-        'resolution_component': 'mean',
-        'quality_component': 'mean'
-    }).reset_index()
+    features = _daily_call_features(df)
+    
+    # Group by date (component scores from precomputed aes_* columns)
+    daily = _group_by_day(features, ['aes', *AES_COMPONENT_COLUMNS])
     
     # Sort by date
     daily = daily.sort_values('date')
@@ -5,7 +5,6 @@ Multi-layer timeline with compliance checkpoints, WPM analysis, and sentiment fl
 
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import pandas as pd
 import numpy as np
 from typing import List, Dict, Optional
 
@@ -21,6 +20,154 @@ COLORS = {
     'customer': '#FF9800',
 }
 
+# Sentiment background buckets: upper bounds (exclusive) and fill colors, red -> green
+SENTIMENT_BG_THRESHOLDS = np.array([-0.3, 0.0, 0.3])
+SENTIMENT_BG_COLORS = (
+    'rgba(239, 83, 80, 0.15)',   # Red
+    'rgba(255, 167, 38, 0.15)',  # Orange
+    'rgba(100, 221, 23, 0.15)',  # Light green
+    'rgba(0, 200, 83, 0.15)',    # Green
+)
+
+# Sentiment spread below which a call is drawn as one flat background color
+SENTIMENT_FLAT_RANGE = 0.05
+
+# Stepwise colorscale for the background heatmap: bucket index z (0..3) -> its flat color
+SENTIMENT_BG_COLORSCALE = [
+    [bound, color]
+    for i, color in enumerate(SENTIMENT_BG_COLORS)
+    for bound in (i / len(SENTIMENT_BG_COLORS), (i + 1) / len(SENTIMENT_BG_COLORS))
+]
+
+# Vertical extent (y cell edges) of the background band
+SENTIMENT_BG_Y_EDGES = [-0.4, 1.4]
+
+# Assumed plot width for pixel-based downsampling of segments and silence overlays
+TIMELINE_PLOT_WIDTH_PX = 1200
+
+# WPM row (x2/y2 axes) background zones as one heatmap column: y cell edges, z per band (NaN = no background)
+WPM_ZONE_Y_EDGES = [0, 100, 160, 200, 250]
+WPM_ZONE_Z = [
+    [0],       # Slow zone (<100 WPM)
+    [np.nan],  # Normal zone (100-160 WPM) - no background
+    [1],       # Fast zone (160-200 WPM)
+    [2],       # Too fast zone (>200 WPM)
+]
+WPM_ZONE_COLORSCALE = [
+    [0.0, 'rgba(173, 216, 230, 0.15)'], [1 / 3, 'rgba(173, 216, 230, 0.15)'],  # Light blue
+    [1 / 3, 'rgba(255, 255, 0, 0.1)'], [2 / 3, 'rgba(255, 255, 0, 0.1)'],      # Yellow
+    [2 / 3, 'rgba(255, 0, 0, 0.1)'], [1.0, 'rgba(255, 0, 0, 0.1)'],            # Red
+]
+
+# WPM reference lines: Slow, Fast, Too Fast
+WPM_REFERENCE_LEVELS = (100, 160, 200)
+
+# Static axes and overall layout of the two-row timeline (row 1 = xaxis/yaxis, row 2 = xaxis2/yaxis2)
+TIMELINE_LAYOUT = dict(
+    xaxis2=dict(
+        showgrid=True,
+        gridcolor='#e5e7eb',
+        title_text='Time (seconds)'
+    ),
+    yaxis=dict(
+        title_text='',
+        tickvals=[0, 1],
+        ticktext=['CUSTOMER', 'AGENT'],
+        range=[-0.5, 1.5]
+    ),
+    yaxis2=dict(
+        title_text='WPM',
+        range=[50, 250]
+    ),
+    barmode='overlay',
+    height=550,
+    margin=dict(l=80, r=40, t=80, b=80),
+    plot_bgcolor='white',
+    paper_bgcolor='white',
+    hovermode='closest',
+    font=dict(family='Inter', size=12),
+    showlegend=True,
+    legend=dict(
+        orientation="h",
+        yanchor="top",
+        y=-0.12,
+        xanchor="center",
+        x=0.5
+    )
+)
+
+
+def _quadratic_through_points(times: List[float], values: List[float], x: np.ndarray) -> np.ndarray:
+    """
+    Evaluates the quadratic through three points at x.
+    
+    Same curve as a degree-2 polyfit on exactly three points, without the
+    least-squares solve: coefficients are the Newton divided differences
+    (scalar math), evaluated in nested Horner form with in-place array ops.
+    
+    Args:
+        times: Three distinct x coordinates
+        values: Values at those coordinates
+        x: Points to evaluate at
+        
+    Returns:
+        Interpolated values at x
+    """
+    (t0, t1, t2), (v0, v1, v2) = times, values
+    slope_01 = (v1 - v0) / (t1 - t0)
+    slope_12 = (v2 - v1) / (t2 - t1)
+    curvature = (slope_12 - slope_01) / (t2 - t0)
+    
+    # v0 + (x - t0) * (slope_01 + (x - t1) * curvature)
+    result = x - t1
+    result *= curvature
+    result += slope_01
+    result *= x - t0
+    result += v0
+    return result
+
+
+def _drop_narrow_spans(spans: List[Dict], start_key: str, end_key: str, min_span: float) -> List[Dict]:
+    """
+    Keeps only spans at least min_span seconds long.
+    
+    Args:
+        spans: Segments or silence periods
+        start_key: Key of the span start time
+        end_key: Key of the span end time
+        min_span: Shortest span (seconds) still drawn
+        
+    Returns:
+        Filtered list
+    """
+    if min_span <= 0:
+        return spans
+    return [span for span in spans if span[end_key] - span[start_key] >= min_span]
+
+
+def _build_timeline_base() -> go.Figure:
+    """
+    Builds the static 2-row timeline scaffold shared by every rendered call.
+    
+    Returns:
+        Plotly Figure with subplots, axes and layout but no traces
+    """
+    # Create subplot with 2 rows
+    fig = make_subplots(
+        rows=2, cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.12,
+        row_heights=[0.6, 0.4],
+        subplot_titles=('📞 Call Timeline with Compliance Checkpoints', '🗣️ Speaking Rate (WPM)'),
+        specs=[[{"secondary_y": False}], [{"secondary_y": False}]]
+    )
+    fig.update_layout(TIMELINE_LAYOUT)
+    return fig
+
+
+# Built once at import; create_enhanced_timeline copies it and adds only the per-call data
+TIMELINE_BASE_FIGURE = _build_timeline_base()
+
 
 def create_enhanced_timeline(
     segments: List[Dict],
@@ -28,7 +175,8 @@ def create_enhanced_timeline(
     sentiment_points: List[Dict],
     wpm_data: Dict,
     silence_periods: List[Dict],
-    call_duration: float
+    call_duration: float,
+    min_pixel_width: float = 2
 ) -> go.Figure:
     """
     Creates simple Gantt-style timeline with sentiment background gradient.
@@ -43,20 +191,20 @@ def create_enhanced_timeline(
         }
         silence_periods: [{start, end, type}, ...]
         call_duration: Total call length in seconds
+        min_pixel_width: Segments and silence overlays narrower than this many pixels
+            (at TIMELINE_PLOT_WIDTH_PX across the call) are not drawn
         
     Returns:
         Plotly Figure with 2 subplots
     """
     
-    # Create subplot with 2 rows
-    fig = make_subplots(
-        rows=2, cols=1,
-        shared_xaxes=True,
-        vertical_spacing=0.12,
-        row_heights=[0.6, 0.4],
-        subplot_titles=('📞 Call Timeline with Compliance Checkpoints', '🗣️ Speaking Rate (WPM)'),
-        specs=[[{"secondary_y": False}], [{"secondary_y": False}]]
-    )
+    # Drop spans too narrow to be visible (they would only add bars/shapes)
+    min_span = min_pixel_width * call_duration / TIMELINE_PLOT_WIDTH_PX if call_duration > 0 else 0
+    segments = _drop_narrow_spans(segments, 'start_time', 'end_time', min_span)
+    silence_periods = _drop_narrow_spans(silence_periods, 'start', 'end', min_span)
+    
+    # Start from a copy of the static 2-row scaffold (subplots, axes, layout)
+    fig = go.Figure(TIMELINE_BASE_FIGURE)
     
     # ============================================================================
     # ROW 1: SPEAKER TIMELINE (Gantt-style) + SENTIMENT BACKGROUND GRADIENT
@@ -67,61 +215,83 @@ def create_enhanced_timeline(
         times = [p['time'] for p in sentiment_points]
         sentiments = [p['sentiment'] for p in sentiment_points]
         
-        # Interpolate sentiment for smooth gradient
-        smooth_times = np.linspace(times[0], times[-1], 100)
-        if len(sentiment_points) >= 3:
-            coeffs = np.polyfit(times, sentiments, 2)
-            smooth_sentiments = np.polyval(coeffs, smooth_times)
-        else:
-            smooth_sentiments = np.interp(smooth_times, times, sentiments)
+        point_buckets = np.searchsorted(SENTIMENT_BG_THRESHOLDS, sentiments, side='right')
         
-        # Add sentiment background as colored rectangles
-        for i in range(len(smooth_times) - 1):
-            t_start = smooth_times[i]
-            t_end = smooth_times[i + 1]
-            s_avg = (smooth_sentiments[i] + smooth_sentiments[i + 1]) / 2
-            
-            # Determine color
-            if s_avg >= 0.3:
-                bg_color = 'rgba(0, 200, 83, 0.15)'  # Green
-            elif s_avg >= 0:
-                bg_color = 'rgba(100, 221, 23, 0.15)'  # Light green
-            elif s_avg >= -0.3:
-                bg_color = 'rgba(255, 167, 38, 0.15)'  # Orange
+        if np.ptp(sentiments) < SENTIMENT_FLAT_RANGE and (point_buckets == point_buckets[0]).all():
+            # Flat sentiment within one color bucket - a single background rectangle, no curve fit
+            t_start = np.array([times[0]], dtype=float)
+            t_end = np.array([times[-1]], dtype=float)
+            buckets = point_buckets[:1]
+        else:
+            # Interpolate sentiment for smooth gradient
+            smooth_times = np.linspace(times[0], times[-1], 100)
+            if len(sentiment_points) == 3 and len(set(times)) == 3:
+                smooth_sentiments = _quadratic_through_points(times, sentiments, smooth_times)
+            elif len(sentiment_points) >= 3:
+                coeffs = np.polyfit(times, sentiments, 2)
+                smooth_sentiments = np.polyval(coeffs, smooth_times)
             else:
-                bg_color = 'rgba(239, 83, 80, 0.15)'  # Red
+                smooth_sentiments = np.interp(smooth_times, times, sentiments)
             
-            fig.add_shape(
-                type="rect",
-                x0=t_start, x1=t_end,
-                y0=-0.4, y1=1.4,
-                line=dict(width=0),
-                fillcolor=bg_color,
-                layer="below",
-                row=1, col=1
-            )
-    
-    # Second: Add speaker segments (Gantt bars)
-    for seg in segments:
-        y_pos = 1 if seg["speaker"] == "AGENT" else 0
-        color = COLORS["agent"] if seg["speaker"] == "AGENT" else COLORS["customer"]
-        duration = seg["end_time"] - seg["start_time"]
+            t_start = smooth_times[:-1]
+            t_end = smooth_times[1:]
+            s_avg = (smooth_sentiments[:-1] + smooth_sentiments[1:]) / 2
+            buckets = np.searchsorted(SENTIMENT_BG_THRESHOLDS, s_avg, side='right')
         
-        # Truncate text for hover
-        text_preview = seg.get('text', '')[:200] + ('...' if len(seg.get('text', '')) > 200 else '')
+        # Collapse runs of equal-color slices into one cell each (run-length encoding)
+        run_starts = np.flatnonzero(np.diff(buckets)) + 1
+        run_starts = np.insert(run_starts, 0, 0)
         
-        fig.add_trace(go.Bar(
-            x=[duration],
-            y=[y_pos],
-            base=[seg["start_time"]],
-            orientation='h',
-            name=seg["speaker"],
-            marker=dict(color=color, opacity=0.9, line=dict(width=0.5, color='white')),
-            hovertext=f"<b>{seg['speaker']}</b><br>{text_preview}<br>Time: {seg['start_time']:.1f}s - {seg['end_time']:.1f}s",
-            hovertemplate='%{hovertext}<extra></extra>',
-            showlegend=False
+        # Add sentiment background as one heatmap row: x cell edges, z = color bucket per run
+        fig.add_trace(go.Heatmap(
+            x=np.append(t_start[run_starts], t_end[-1]),
+            y=SENTIMENT_BG_Y_EDGES,
+            z=buckets[run_starts][np.newaxis, :],
+            zmin=0,
+            zmax=len(SENTIMENT_BG_COLORS) - 1,
+            colorscale=SENTIMENT_BG_COLORSCALE,
+            showscale=False,
+            hoverinfo='skip'
         ), row=1, col=1)
     
+    # Second: Add speaker segments (Gantt bars) - one Bar trace per speaker
+    if segments:
+        is_agent = np.array([seg["speaker"] == "AGENT" for seg in segments])
+        starts = np.fromiter((seg["start_time"] for seg in segments), dtype=float, count=len(segments))
+        ends = np.fromiter((seg["end_time"] for seg in segments), dtype=float, count=len(segments))
+        
+        # Truncate text for hover (text looked up once per segment)
+        hover_texts = [
+            f"<b>{seg['speaker']}</b><br>"
+            f"{text[:200] + ('...' if len(text) > 200 else '')}"
+            f"<br>Time: {seg['start_time']:.1f}s - {seg['end_time']:.1f}s"
+            for seg, text in zip(segments, (seg.get('text', '') for seg in segments))
+        ]
+        
+        hover_texts = np.array(hover_texts, dtype=object)
+        
+        for in_lane, y_pos, name, color in (
+            (is_agent, 1, 'Agent', COLORS["agent"]),
+            (~is_agent, 0, 'Customer', COLORS["customer"]),
+        ):
+            if not in_lane.any():
+                continue
+            fig.add_trace(go.Bar(
+                x=ends[in_lane] - starts[in_lane],
+                y=np.full(in_lane.sum(), y_pos),
+                base=starts[in_lane],
+                orientation='h',
+                name=name,
+                marker=dict(
+                    color=color,
+                    opacity=0.9,
+                    line=dict(width=0.5, color='white')
+                ),
+                hovertext=hover_texts[in_lane].tolist(),
+                hovertemplate='%{hovertext}<extra></extra>',
+                showlegend=False
+            ), row=1, col=1)
+    
     # Add pause/hold overlays
     for period in silence_periods:
         if period["type"] == "hold":
@@ -150,91 +320,72 @@ def create_enhanced_timeline(
             )
     
     # Add compliance checkpoints AS TIMESTAMPS (vertical lines with labels)
-    for checkpoint in compliance_checkpoints:
-        icon = '✅' if checkpoint['passed'] else '❌'
-        color = COLORS['excellent'] if checkpoint['passed'] else COLORS['critical']
+    # Dotted lines: one None-separated Scatter per pass/fail color; labels in one annotations update
+    if compliance_checkpoints:
+        passed = [bool(checkpoint['passed']) for checkpoint in compliance_checkpoints]
         
-        # Vertical line
-        fig.add_shape(
-            type="line",
-            x0=checkpoint['time'], x1=checkpoint['time'],
-            y0=-0.3, y1=1.3,
-            line=dict(color=color, width=2, dash='dot'),
-            row=1, col=1
-        )
+        for is_passed, color in ((True, COLORS['excellent']), (False, COLORS['critical'])):
+            times = [checkpoint['time'] for checkpoint, ok in zip(compliance_checkpoints, passed) if ok is is_passed]
+            if not times:
+                continue
+            fig.add_trace(go.Scatter(
+                x=[x for t in times for x in (t, t, None)],
+                y=[-0.3, 1.3, None] * len(times),
+                mode='lines',
+                line=dict(color=color, width=2, dash='dot'),
+                hoverinfo='skip',
+                showlegend=False
+            ), row=1, col=1)
         
-        # Label at bottom
-        fig.add_annotation(
-            x=checkpoint['time'],
-            y=-0.35,
-            text=f"{icon} {checkpoint['type']}",
-            showarrow=False,
-            font=dict(size=10, color=color, family='Inter'),
-            textangle=-45,
-            xanchor='right',
-            yanchor='top',
-            row=1, col=1
-        )
+        # Labels at bottom
+        fig.update_layout(annotations=[*fig.layout.annotations, *(
+            dict(
+                x=checkpoint['time'],
+                y=-0.35,
+                xref='x',
+                yref='y',
+                text=f"{'✅' if ok else '❌'} {checkpoint['type']}",
+                showarrow=False,
+                font=dict(size=10, color=COLORS['excellent'] if ok else COLORS['critical'], family='Inter'),
+                textangle=-45,
+                xanchor='right',
+                yanchor='top'
+            )
+            for checkpoint, ok in zip(compliance_checkpoints, passed)
+        )])
     
     # ============================================================================
     # ROW 2: SPEAKING RATE (WPM) with zones
     # ============================================================================
     
-    # Add WPM reference zones (background rectangles)
-    # Slow zone (<100 WPM)
-    fig.add_shape(
-        type="rect",
-        x0=0, x1=call_duration,
-        y0=0, y1=100,
-        line=dict(width=0),
-        fillcolor='lightblue',
-        opacity=0.15,
-        layer="below",
-        row=2, col=1
-    )
-    
-    # Normal zone (100-160 WPM) - no background
-    
-    # Fast zone (160-200 WPM)
-    fig.add_shape(
-        type="rect",
-        x0=0, x1=call_duration,
-        y0=160, y1=200,
-        line=dict(width=0),
-        fillcolor='yellow',
-        opacity=0.1,
-        layer="below",
-        row=2, col=1
-    )
-    
-    # Too fast zone (>200 WPM)
-    fig.add_shape(
-        type="rect",
-        x0=0, x1=call_duration,
-        y0=200, y1=250,
-        line=dict(width=0),
-        fillcolor='red',
-        opacity=0.1,
-        layer="below",
-        row=2, col=1
-    )
+    # Add WPM reference zones (one heatmap column spanning the call)
+    fig.add_trace(go.Heatmap(
+        x=[0, call_duration],
+        y=WPM_ZONE_Y_EDGES,
+        z=WPM_ZONE_Z,
+        zmin=0,
+        zmax=2,
+        colorscale=WPM_ZONE_COLORSCALE,
+        showscale=False,
+        hoverinfo='skip'
+    ), row=2, col=1)
     
-    # Add reference lines
-    for threshold, label in [(100, 'Slow'), (160, 'Fast'), (200, 'Too Fast')]:
-        fig.add_shape(
-            type="line",
-            x0=0, x1=call_duration,
-            y0=threshold, y1=threshold,
-            line=dict(color=COLORS['neutral'], width=1, dash='dash'),
-            row=2, col=1
-        )
+    # Add WPM reference lines (one None-separated Scatter)
+    fig.add_trace(go.Scatter(
+        x=[0, call_duration, None] * len(WPM_REFERENCE_LEVELS),
+        y=[y for level in WPM_REFERENCE_LEVELS for y in (level, level, None)],
+        mode='lines',
+        line=dict(color=COLORS['neutral'], width=1, dash='dash'),
+        hoverinfo='skip',
+        showlegend=False
+    ), row=2, col=1)
     
     # Plot agent WPM line
     if wpm_data.get('agent'):
-        agent_df = pd.DataFrame(wpm_data['agent'])
+        agent_wpm = wpm_data['agent']
         fig.add_trace(go.Scatter(
-            x=agent_df['time'],
-            y=agent_df['wpm'],
+            x=np.fromiter((p['time'] for p in agent_wpm), dtype=float, count=len(agent_wpm)),
+            y=np.fromiter((p['wpm'] for p in agent_wpm), dtype=float, count=len(agent_wpm)),
             mode='lines+markers',
             name='Agent WPM',
             line=dict(color=COLORS['agent'], width=2),
@@ -244,10 +395,10 @@ def create_enhanced_timeline(
     
     # Plot customer WPM line
     if wpm_data.get('customer'):
-        customer_df = pd.DataFrame(wpm_data['customer'])
+        customer_wpm = wpm_data['customer']
         fig.add_trace(go.Scatter(
-            x=customer_df['time'],
-            y=customer_df['wpm'],
+            x=np.fromiter((p['time'] for p in customer_wpm), dtype=float, count=len(customer_wpm)),
+            y=np.fromiter((p['wpm'] for p in customer_wpm), dtype=float, count=len(customer_wpm)),
             mode='lines+markers',
             name='Customer WPM',
             line=dict(color=COLORS['customer'], width=2),
@@ -261,45 +412,6 @@ def create_enhanced_timeline(
     # ============================================================================
     
     # Update axes
-    fig.update_xaxes(
-        showgrid=True,
-        gridcolor='#e5e7eb',
-        title_text='Time (seconds)',
-        row=2, col=1
-    )
-    
-    fig.update_yaxes(
-        title_text='',
-        tickvals=[0, 1],
-        ticktext=['CUSTOMER', 'AGENT'],
-        range=[-0.5, 1.5],
-        row=1, col=1
-    )
-    
-    fig.update_yaxes(
-        title_text='WPM',
-        range=[50, 250],
-        row=2, col=1
-    )
-    
-    # Overall layout
-    fig.update_layout(
-        height=550,
-        margin=dict(l=80, r=40, t=80, b=80),
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        hovermode='closest',
-        font=dict(family='Inter', size=12),
-        showlegend=True,
-        legend=dict(
-            orientation="h",
-            yanchor="top",
-            y=-0.12,
-            xanchor="center",
-            x=0.5
-        )
-    )
-    
     return fig
 
 
@@ -316,20 +428,27 @@ def calculate_timeline_stats(
         Dict with summary stats for display below timeline
     """
     
-    # Pause/Hold stats
-    pause_count = sum(1 for p in silence_periods if p['type'] == 'pause')
-    hold_count = sum(1 for p in silence_periods if p['type'] == 'hold')
-    pause_total = sum(p['end'] - p['start'] for p in silence_periods if p['type'] == 'pause')
-    hold_total = sum(p['end'] - p['start'] for p in silence_periods if p['type'] == 'hold')
+    # Pause/Hold stats (types and durations extracted once, then masked reductions)
+    silence_types = np.array([p['type'] for p in silence_periods], dtype=object)
+    silence_durations = np.fromiter(
+        (p['end'] - p['start'] for p in silence_periods), dtype=float, count=len(silence_periods)
+    )
+    pause_mask = silence_types == 'pause'
+    hold_mask = silence_types == 'hold'
+    
+    pause_count = int(pause_mask.sum())
+    hold_count = int(hold_mask.sum())
+    pause_total = float(silence_durations[pause_mask].sum())
+    hold_total = float(silence_durations[hold_mask].sum())
     
-    # WPM stats
-    agent_wpm_values = [p['wpm'] for p in wpm_data.get('agent', [])]
-    customer_wpm_values = [p['wpm'] for p in wpm_data.get('customer', [])]
+    # WPM stats (values converted to an array once, mean and peak reduced from it)
+    agent_wpm_values = np.array([p['wpm'] for p in wpm_data.get('agent', [])], dtype=float)
+    customer_wpm_values = np.array([p['wpm'] for p in wpm_data.get('customer', [])], dtype=float)
     
-    agent_wpm_avg = np.mean(agent_wpm_values) if agent_wpm_values else 0
-    agent_wpm_peak = max(agent_wpm_values) if agent_wpm_values else 0
-    customer_wpm_avg = np.mean(customer_wpm_values) if customer_wpm_values else 0
-    customer_wpm_peak = max(customer_wpm_values) if customer_wpm_values else 0
+    agent_wpm_avg = float(agent_wpm_values.mean()) if agent_wpm_values.size else 0
+    agent_wpm_peak = float(agent_wpm_values.max()) if agent_wpm_values.size else 0
+    customer_wpm_avg = float(customer_wpm_values.mean()) if customer_wpm_values.size else 0
+    customer_wpm_peak = float(customer_wpm_values.max()) if customer_wpm_values.size else 0
     
     # Sentiment delta
     if len(sentiment_points) >= 2:
@@ -6,8 +6,11 @@ Helper funkcie pre vizualizácie a UI widgety
 import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
+import numpy as np
 from typing import Dict, List
 
+from metrics import compute_sentiment_buckets, calculate_volume_distribution, compute_quality_components_daily
+
 
 # ============================================================================
 # COLORS & STYLING
@@ -29,6 +32,28 @@ COLOR_SCHEME = {
     "hold": "#ef4444",
 }
 
+# Farba sentimentu: hranice košov (s >= hranica → vyšší kôš) a paleta od najhoršieho po najlepší
+SENTIMENT_COLOR_BINS = np.array([-0.3, 0.0, 0.3])
+SENTIMENT_COLOR_PALETTE = np.array([
+    COLOR_SCHEME["danger"],
+    COLOR_SCHEME["warning"],
+    COLOR_SCHEME["info"],
+    COLOR_SCHEME["success"],
+], dtype=object)
+
+
+def sentiment_colors(sentiments: List[float]) -> List[str]:
+    """
+    Farby podľa sentimentu pre všetky body naraz.
+    
+    Args:
+        sentiments: Hodnoty sentimentu -1 až +1
+        
+    Returns:
+        List farieb (success / info / warning / danger)
+    """
+    return SENTIMENT_COLOR_PALETTE[np.digitize(sentiments, SENTIMENT_COLOR_BINS)].tolist()
+
 
 # ============================================================================
 # GAUGE CHARTS
@@ -177,16 +202,7 @@ def create_sentiment_journey_chart(journey: List[tuple]) -> go.Figure:
     positions = [j[2] for j in journey]
     
     # Farba podľa trendu
-    colors = []
-    for s in sentiments:
-        if s >= 0.3:
-            colors.append(COLOR_SCHEME["success"])
-        elif s >= 0:
-            colors.append(COLOR_SCHEME["info"])
-        elif s >= -0.3:
-            colors.append(COLOR_SCHEME["warning"])
-        else:
-            colors.append(COLOR_SCHEME["danger"])
+    colors = sentiment_colors(sentiments)
     
     fig = go.Figure()
     
@@ -394,21 +410,24 @@ def create_timeline_figure(
     """
     fig = go.Figure()
     
-    # 1. Segmenty ako horizontálne bars
-    for seg in segments:
-        y_pos = 1 if seg["speaker"] == "AGENT" else 0
-        color = COLOR_SCHEME["agent"] if seg["speaker"] == "AGENT" else COLOR_SCHEME["customer"]
-        
-        duration = seg["end_time"] - seg["start_time"]
+    # 1. Segmenty ako horizontálne bars - jeden Bar trace na hovoriaceho
+    for lane_segments, y_pos, speaker, color in (
+        ([seg for seg in segments if seg["speaker"] == "AGENT"], 1, "AGENT", COLOR_SCHEME["agent"]),
+        ([seg for seg in segments if seg["speaker"] != "AGENT"], 0, "CUSTOMER", COLOR_SCHEME["customer"]),
+    ):
+        if not lane_segments:
+            continue
+        starts = np.array([seg["start_time"] for seg in lane_segments], dtype=float)
+        ends = np.array([seg["end_time"] for seg in lane_segments], dtype=float)
         
         fig.add_trace(go.Bar(
-            x=[duration],
-            y=[y_pos],
-            base=[seg["start_time"]],
+            x=ends - starts,
+            y=np.full(len(lane_segments), y_pos),
+            base=starts,
             orientation='h',
-            name=seg["speaker"],
+            name=speaker,
             marker=dict(color=color, opacity=0.8),
-            hovertext=f"{seg['speaker']}: {seg['text']}",
+            hovertext=[f"{seg['speaker']}: {seg['text']}" for seg in lane_segments],
             hovertemplate='%{hovertext}<br>Time: %{base:.1f}s - %{x:.1f}s<extra></extra>',
             showlegend=False
         ))
@@ -428,47 +447,43 @@ def create_timeline_figure(
             layer="below"
         )
     
-    # 3. Sentiment markers ako scatter points
-    for m in markers:
+    # 3. Sentiment markers ako scatter points (jeden trace pre všetky markery)
+    if markers:
+        sentiments = [m.get("sentiment", 0) for m in markers]
+        
         # Farba podľa sentimentu
-        sentiment = m.get("sentiment", 0)
-        if sentiment >= 0.3:
-            marker_color = COLOR_SCHEME["success"]
-        elif sentiment >= 0:
-            marker_color = COLOR_SCHEME["info"]
-        elif sentiment >= -0.3:
-            marker_color = COLOR_SCHEME["warning"]
-        else:
-            marker_color = COLOR_SCHEME["danger"]
+        marker_colors = sentiment_colors(sentiments)
         
         fig.add_trace(go.Scatter(
-            x=[m["time"]],
-            y=[1.3],
+            x=[m["time"] for m in markers],
+            y=[1.3] * len(markers),
             mode="markers+text",
-            marker=dict(size=12, color=marker_color, symbol="star"),
-            text=[m["label"]],
+            marker=dict(size=12, color=marker_colors, symbol="star"),
+            text=[m["label"] for m in markers],
             textposition="top center",
             textfont=dict(size=10, color="#1e293b"),
-            hovertext=f"{m['label']}: {sentiment:.2f}",
+            hovertext=[f"{m['label']}: {sentiment:.2f}" for m, sentiment in zip(markers, sentiments)],
             hovertemplate='%{hovertext}<extra></extra>',
             showlegend=False
         ))
     
-    # 4. Interruptions (ak sú)
+    # 4. Interruptions (ak sú) - jeden trace
     if interruptions:
-        for intr in interruptions:
-            # Blesk symbol
-            color = COLOR_SCHEME["danger"] if intr["interrupter"] == "AGENT" else COLOR_SCHEME["warning"]
-            
-            fig.add_trace(go.Scatter(
-                x=[intr["time"]],
-                y=[0.5],
-                mode="markers",
-                marker=dict(size=14, color=color, symbol="diamond", line=dict(width=2, color="white")),
-                hovertext=f"Interruption: {intr['interrupter']} → {intr['interrupted']}",
-                hovertemplate='%{hovertext}<extra></extra>',
-                showlegend=False
-            ))
+        # Blesk symbol
+        fig.add_trace(go.Scatter(
+            x=[intr["time"] for intr in interruptions],
+            y=[0.5] * len(interruptions),
+            mode="markers",
+            marker=dict(
+                size=14,
+                color=[COLOR_SCHEME["danger"] if intr["interrupter"] == "AGENT" else COLOR_SCHEME["warning"] for intr in interruptions],
+                symbol="diamond",
+                line=dict(width=2, color="white")
+            ),
+            hovertext=[f"Interruption: {intr['interrupter']} → {intr['interrupted']}" for intr in interruptions],
+            hovertemplate='%{hovertext}<extra></extra>',
+            showlegend=False
+        ))
     
     # Layout
     fig.update_layout(
@@ -677,7 +692,6 @@ def sentiment_transition_heatmap(df: pd.DataFrame) -> go.Figure:
     Returns:
         Plotly Figure
     """
-    from metrics import compute_sentiment_buckets
     
     transitions = compute_sentiment_buckets(df)
     
@@ -732,7 +746,6 @@ def sentiment_transition_chart(df: pd.DataFrame) -> go.Figure:
     """
     Stacked bar chart showing sentiment flow (compact).
     """
-    from metrics import compute_sentiment_buckets
     
     transitions = compute_sentiment_buckets(df)
     
@@ -868,7 +881,6 @@ def volume_pareto_bars(df: pd.DataFrame) -> go.Figure:
     Returns:
         Plotly Figure
     """
-    from metrics import calculate_volume_distribution
     
     volume_dist = calculate_volume_distribution(df, "topic")
     
@@ -948,7 +960,6 @@ def quality_breakdown_trend_7d(df: pd.DataFrame) -> go.Figure:
     Returns:
         Plotly Figure
     """
-    from metrics import compute_quality_components_daily
     
     daily = compute_quality_components_daily(df)
     